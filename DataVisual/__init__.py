@@ -2,6 +2,12 @@
 # -*- coding: utf-8 -*-
 
 from .multi_array import Array  # noqa: F403 F401
+from .lazy import LazyArray  # noqa: F403 F401
+from .builder import ArrayBuilder  # noqa: F403 F401
+from .async_sweep import AsyncSweep  # noqa: F403 F401
+from .shared import SharedArray, SharedArrayHandle  # noqa: F403 F401
+from .render import render_many  # noqa: F403 F401
+from .sweep import SweepCache  # noqa: F403 F401
 from .tables import Table  # noqa: F403 F401
 from .units import *  # noqa: F403 F401
 
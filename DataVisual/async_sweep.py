@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import asyncio
+from typing import Awaitable, Callable, Iterator
+
+import numpy
+
+from DataVisual.multi_array import Array
+from DataVisual.sweep import get_points
+from DataVisual.tables import Table
+from DataVisual.units import BaseUnit
+
+
+class AsyncSweep:
+    """
+    Evaluates a coroutine function over the Cartesian product of the x_table parameters, with a bounded
+    number of evaluations in flight at once, for I/O-bound evaluations such as requests to simulators.
+
+    A fixed number of worker coroutines pull the grid points one at a time and write each result into
+    a preallocated y buffer as soon as it arrives. The sweep can be cancelled by cancelling the task running
+    `run`, and `build` returns the Array of the results obtained so far at any time, NaN for the pending points.
+
+    Attributes:
+    -----------
+    func : Callable[..., Awaitable]
+        The coroutine function, taking the values of the parameters in the order of the x_table.
+    x_table : Table
+        The table of the X dimensions.
+    y : BaseUnit
+        The unit of the Y dimension, its base values are replaced by the evaluated ones.
+    concurrency : int
+        The maximum number of evaluations in flight at once.
+    done : numpy.ndarray
+        The mask of the evaluated points, of the shape of the x_table.
+    """
+
+    def __init__(
+            self,
+            func: Callable[..., Awaitable],
+            x_table: Table,
+            y: BaseUnit,
+            concurrency: int = 8,
+            dtype: numpy.dtype = numpy.float64):
+        """
+        Args:
+            func (Callable[..., Awaitable]): The coroutine function to evaluate.
+            x_table (Table): The table of the X dimensions.
+            y (BaseUnit): The unit of the Y dimension.
+            concurrency (int, optional): The maximum number of evaluations in flight at once. Default is 8.
+            dtype (numpy.dtype, optional): The data type of the y values, NaN is used for the pending points
+                of floating point types. Default is float64.
+        """
+        self.func = func
+        self.x_table = x_table
+        self.y = y
+        self.concurrency = concurrency
+
+        self._buffer = numpy.full(x_table.shape, numpy.nan, dtype=dtype) if numpy.dtype(dtype).kind in 'fc' \
+            else numpy.zeros(x_table.shape, dtype=dtype)
+        self.done = numpy.zeros(x_table.shape, dtype=bool)
+
+    @property
+    def n_done(self) -> int:
+        """Returns the number of points evaluated so far."""
+        return int(numpy.count_nonzero(self.done))
+
+    async def _work(self, indices: Iterator[int], axes_values: tuple[numpy.ndarray, ...]) -> None:
+        """
+        Evaluates the points pulled from the shared iterator of flat indices until it is exhausted.
+
+        Args:
+            indices (Iterator[int]): The flat indices of the pending points, shared by the workers.
+            axes_values (tuple[numpy.ndarray, ...]): The base values of the x_table parameters.
+        """
+        flat_buffer, flat_done = self._buffer.reshape(-1), self.done.reshape(-1)
+
+        for index in indices:
+            point = get_points(axes_values, index)
+
+            flat_buffer[index] = await self.func(*point)
+            flat_done[index] = True
+
+    async def run(self) -> Array:
+        """
+        Evaluates the points not evaluated yet, so a cancelled sweep can be resumed.
+
+        If an evaluation raises, the other evaluations in flight are cancelled and the exception is raised,
+        the results obtained so far remaining available with `build`.
+
+        Returns:
+            Array: The Array of the evaluated sweep.
+        """
+        axes_values = tuple(numpy.asarray(x.base_values) for x in self.x_table)
+        indices = iter(numpy.flatnonzero(~self.done).tolist())
+
+        workers = [
+            asyncio.ensure_future(self._work(indices, axes_values)) for _ in range(min(self.concurrency, self.done.size))
+        ]
+
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
+
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        return self.build()
+
+    def build(self) -> Array:
+        """
+        Returns the Array of the results obtained so far.
+
+        The y values are a copy of the buffer, so the returned Array is not modified by the ongoing evaluations.
+
+        Returns:
+            Array: The Array instance, NaN for the pending points.
+        """
+        return Array(x_table=self.x_table, y=self.y.clone(base_values=self._buffer.copy()))
+
+# -
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import numpy
+
+from DataVisual.multi_array import Array
+from DataVisual.statistics import RunningMoments
+from DataVisual.tables import Table
+from DataVisual.units import BaseUnit
+
+
+class ArrayBuilder:
+    """
+    Incrementally builds an Array from slices arriving one at a time along one axis of the x_table.
+
+    The y buffer is preallocated for the size of the axis and grows geometrically if more slices arrive,
+    the running mean and variance of every cell across the slices are kept up to date, and `build`
+    returns an Array viewing the buffer, without a final copy.
+
+    Attributes:
+    -----------
+    x_table : Table
+        The table of the X dimensions of the Array to build.
+    y : BaseUnit
+        The unit of the Y dimension, its base values are replaced by the built ones.
+    axis : BaseUnit
+        The axis along which slices are appended.
+    moments : RunningMoments
+        The running moments of each cell across the appended slices.
+    """
+
+    def __init__(
+            self,
+            x_table: Table,
+            y: BaseUnit,
+            axis: BaseUnit | None = None,
+            capacity: int | None = None,
+            dtype: numpy.dtype = numpy.float64):
+        """
+        Args:
+            x_table (Table): The table of the X dimensions of the Array to build.
+            y (BaseUnit): The unit of the Y dimension.
+            axis (BaseUnit, optional): The axis along which slices are appended. Default is the outermost one.
+            capacity (int, optional): The number of slices to preallocate. Default is the size of the axis.
+            dtype (numpy.dtype, optional): The data type of the y values. Default is float64.
+        """
+        self.x_table = x_table
+        self.y = y
+        self.axis = axis if axis is not None else x_table[0]
+        self.position = x_table.get_position(self.axis)
+
+        self.slice_shape = tuple(x.size for x in x_table if x is not self.axis)
+
+        shape = list(self.slice_shape)
+        shape.insert(self.position, capacity or self.axis.size)
+        self._buffer = numpy.empty(shape, dtype=dtype)
+
+        self.count = 0
+        self.axis_values = []
+        self.moments = RunningMoments()
+
+    @property
+    def capacity(self) -> int:
+        """Returns the number of slices the buffer can hold before growing."""
+        return self._buffer.shape[self.position]
+
+    def _get_slicer(self, index: int | slice) -> tuple:
+        """Returns the slicer selecting the given index along the append axis of the buffer."""
+        return (slice(None),) * self.position + (index,)
+
+    def _grow(self) -> None:
+        """Doubles the capacity of the buffer, copying the slices appended so far."""
+        shape = list(self._buffer.shape)
+        shape[self.position] = 2 * max(1, self.capacity)
+
+        buffer = numpy.empty(shape, dtype=self._buffer.dtype)
+        buffer[self._get_slicer(slice(0, self.count))] = self._buffer[self._get_slicer(slice(0, self.count))]
+
+        self._buffer = buffer
+
+    def append(self, values: numpy.ndarray, axis_value: float | None = None) -> None:
+        """
+        Appends one slice of y values along the append axis.
+
+        Args:
+            values (numpy.ndarray): The y values of the slice, with the shape of the x_table without the append axis.
+            axis_value (float, optional): The value of the append axis for this slice. Default is the value
+                at the same index in the axis base values.
+        """
+        values = numpy.asarray(values)
+
+        if values.shape != self.slice_shape:
+            raise ValueError(f"Slice of shape {values.shape} does not match the expected shape {self.slice_shape}.")
+
+        if self.count == self.capacity:
+            self._grow()
+
+        self._buffer[self._get_slicer(self.count)] = values
+        self.moments.update(values)
+
+        if axis_value is not None:
+            self.axis_values.append(axis_value)
+
+        self.count += 1
+
+    @property
+    def mean(self) -> numpy.ndarray:
+        """Returns the running mean of each cell across the appended slices."""
+        return self.moments.mean
+
+    @property
+    def std(self) -> numpy.ndarray:
+        """Returns the running standard deviation of each cell across the appended slices."""
+        return self.moments.std
+
+    def build(self) -> Array:
+        """
+        Returns the Array of the slices appended so far.
+
+        The y values are a view of the builder buffer rather than a copy of it.
+
+        Returns:
+            Array: The built Array instance.
+        """
+        if self.axis_values:
+            if len(self.axis_values) != self.count:
+                raise ValueError("An axis value must be given either for every appended slice or for none.")
+
+            axis_values = numpy.asarray(self.axis_values)
+        elif self.count <= self.axis.size:
+            axis_values = self.axis.base_values[:self.count]
+        else:
+            raise ValueError("More slices than axis values were appended, the axis values must be given to append.")
+
+        axis = self.axis.clone(base_values=axis_values)
+        x_table = Table([axis if x is self.axis else x for x in self.x_table])
+
+        values = self._buffer[self._get_slicer(slice(0, self.count))]
+
+        return Array(x_table=x_table, y=self.y.clone(base_values=values))
+
+# -
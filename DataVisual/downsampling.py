@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import numpy
+
+
+def minmax(x: numpy.ndarray, y: numpy.ndarray, n_out: int) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """
+    Decimates curves by keeping the minimum and the maximum of each of n_out / 2 buckets, in x order.
+
+    With one bucket per pixel column, the rendered line spans the same vertical extent in each column as the full curve.
+
+    Args:
+        x (numpy.ndarray): The x values shared by the curves, of shape (n_x,).
+        y (numpy.ndarray): The curves, of shape (n_curves, n_x).
+        n_out (int): The number of points to keep per curve.
+
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray]: The x and y values of the decimated curves, both of shape (n_curves, n_out).
+    """
+    n_curves, n_x = y.shape
+    n_buckets = max(1, n_out // 2)
+    bucket_size = -(-n_x // n_buckets)
+
+    # Pad with the last point so the curves split in equal buckets, the padding never changes a min or max
+    padded = numpy.pad(y, ((0, 0), (0, n_buckets * bucket_size - n_x)), mode='edge')
+    buckets = padded.reshape(n_curves, n_buckets, bucket_size)
+
+    offsets = numpy.arange(n_buckets) * bucket_size
+    minimum = numpy.minimum(buckets.argmin(axis=-1) + offsets, n_x - 1)
+    maximum = numpy.minimum(buckets.argmax(axis=-1) + offsets, n_x - 1)
+
+    indices = numpy.stack([numpy.minimum(minimum, maximum), numpy.maximum(minimum, maximum)], axis=-1)
+    indices = indices.reshape(n_curves, -1)
+
+    return x[indices], numpy.take_along_axis(y, indices, axis=-1)
+
+
+def lttb(x: numpy.ndarray, y: numpy.ndarray, n_out: int) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """
+    Decimates curves with the Largest-Triangle-Three-Buckets algorithm, vectorized across the curves.
+
+    The first and last points are kept, and in each of the n_out - 2 buckets in between the point forming
+    the largest triangle with the previously kept point and the average of the next bucket is kept.
+
+    Args:
+        x (numpy.ndarray): The x values shared by the curves, of shape (n_x,).
+        y (numpy.ndarray): The curves, of shape (n_curves, n_x).
+        n_out (int): The number of points to keep per curve, at least 3.
+
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray]: The x and y values of the decimated curves, both of shape (n_curves, n_out).
+    """
+    n_curves, n_x = y.shape
+    n_out = max(3, n_out)
+
+    # Bucket boundaries over the points between the first and the last ones
+    edges = (1 + numpy.arange(n_out - 1) * (n_x - 2) / (n_out - 2)).astype(int)
+    edges[-1] = n_x - 1
+
+    indices = numpy.empty((n_curves, n_out), dtype=int)
+    indices[:, 0], indices[:, -1] = 0, n_x - 1
+
+    curves = numpy.arange(n_curves)
+
+    for bucket in range(n_out - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+
+        if bucket + 2 < len(edges):
+            next_x = x[stop:edges[bucket + 2]].mean()
+            next_y = y[:, stop:edges[bucket + 2]].mean(axis=-1)
+        else:
+            next_x, next_y = x[-1], y[:, -1]
+
+        previous = indices[:, bucket]
+        previous_x, previous_y = x[previous], y[curves, previous]
+
+        # Twice the area of the triangles formed with each candidate point of the bucket
+        area = numpy.abs(
+            (previous_x - next_x)[:, None] * (y[:, start:stop] - previous_y[:, None])
+            - (previous_x[:, None] - x[start:stop]) * (next_y - previous_y)[:, None]
+        )
+
+        indices[:, bucket + 1] = start + area.argmax(axis=-1)
+
+    return x[indices], numpy.take_along_axis(y, indices, axis=-1)
+
+
+methods = {'minmax': minmax, 'lttb': lttb}
+
+
+def downsample(
+        x: numpy.ndarray,
+        y: numpy.ndarray,
+        method: str,
+        n_out: int) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """
+    Decimates curves with the given method, or returns them as is if they already have at most n_out points.
+
+    Args:
+        x (numpy.ndarray): The x values shared by the curves, of shape (n_x,).
+        y (numpy.ndarray): The curves, of shape (n_curves, n_x).
+        method (str): The decimation method, 'minmax' or 'lttb'.
+        n_out (int): The number of points to keep per curve.
+
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray]: The x and y values of the curves, both of shape (n_curves, n_points).
+    """
+    if y.shape[-1] <= n_out:
+        return numpy.broadcast_to(x, y.shape), y
+
+    return methods[method](x, y, n_out)
+
+# -
@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from dataclasses import dataclass, field
+from typing import Any, Iterable, NoReturn
+
+import numpy
+
+from DataVisual import statistics
+from DataVisual.tables import Table
+from DataVisual.units import BaseUnit
+
+
+@dataclass
+class LazyArray:
+    """
+    A deferred view of an Array on which reductions are recorded instead of being computed.
+
+    The recorded operations form a chain that is only evaluated on `compute`, `plot` or value access.
+    Consecutive means are fused into a single multi-axis mean and the intermediate results are kept as
+    plain numpy arrays, so no intermediate Array or Table is built.
+
+    Attributes:
+    -----------
+    source : Array
+        The Array on which the operations are applied.
+    operations : tuple[tuple[str, tuple[BaseUnit, ...]], ...]
+        The recorded operations, as (reduction name, reduction axes) pairs.
+    """
+
+    source: Any
+    operations: tuple[tuple[str, tuple[BaseUnit, ...]], ...] = ()
+    _result: Any = field(default=None, init=False, repr=False)
+
+    def _append(self, name: str, axis: BaseUnit | Iterable[BaseUnit]) -> 'LazyArray':
+        """
+        Returns a new LazyArray with the given reduction appended to the recorded operations.
+
+        Args:
+            name (str): The name of the reduction, a key of `statistics.reductions`.
+            axis (BaseUnit | Iterable[BaseUnit]): The axis, or axes, along which to reduce.
+
+        Returns:
+            LazyArray: The new LazyArray instance.
+        """
+        axes = self.source._get_axes(axis)
+
+        remaining = self.remaining_axes
+        for x in axes:
+            if not any(x is parameter for parameter in remaining):
+                raise ValueError(f"The axis {x} is not part of the remaining axes: {remaining}.")
+
+        return LazyArray(source=self.source, operations=self.operations + ((name, axes),))
+
+    def mean(self, axis: BaseUnit | Iterable[BaseUnit]) -> 'LazyArray':
+        """Records a mean along the specified axis, or axes."""
+        return self._append('mean', axis)
+
+    def std(self, axis: BaseUnit | Iterable[BaseUnit]) -> 'LazyArray':
+        """Records a standard deviation along the specified axis, or axes."""
+        return self._append('std', axis)
+
+    def rsd(self, axis: BaseUnit | Iterable[BaseUnit]) -> 'LazyArray':
+        """Records a relative standard deviation along the specified axis, or axes."""
+        return self._append('rsd', axis)
+
+    @property
+    def remaining_axes(self) -> list[BaseUnit]:
+        """Returns the axes of the source x_table that are left once the recorded operations are applied."""
+        reduced = [x for _, axes in self.operations for x in axes]
+
+        return [x for x in self.source.x_table if not any(x is axis for axis in reduced)]
+
+    def get_fused_operations(self) -> list[tuple[str, tuple[BaseUnit, ...]]]:
+        """
+        Returns the recorded operations with consecutive means merged into a single multi-axis mean.
+
+        Returns:
+            list[tuple[str, tuple[BaseUnit, ...]]]: The operations to evaluate.
+        """
+        fused = []
+        for name, axes in self.operations:
+            if fused and name == 'mean' and fused[-1][0] == 'mean':
+                fused[-1] = ('mean', fused[-1][1] + axes)
+            else:
+                fused.append((name, axes))
+
+        return fused
+
+    def compute(self) -> Any:
+        """
+        Evaluates the recorded operations and returns the resulting Array.
+
+        The result is cached, so further value accesses do not evaluate the operations again.
+
+        Returns:
+            Array: The Array resulting from the recorded operations.
+        """
+        if self._result is not None:
+            return self._result
+
+        if not self.operations:
+            self._result = self.source
+            return self._result
+
+        values = self.source.y.base_values
+        current_axes = list(self.source.x_table)
+        reduced_axes = ()
+
+        for name, axes in self.get_fused_operations():
+            positions = tuple(
+                next(idx for idx, parameter in enumerate(current_axes) if parameter is x) for x in axes
+            )
+
+            values = statistics.reduce(name, values, axis=positions)
+
+            current_axes = [parameter for idx, parameter in enumerate(current_axes) if idx not in positions]
+            reduced_axes += axes
+
+        # Once an RSD is taken the values are dimensionless, whatever the reductions that follow
+        relative = any(name == 'rsd' for name, _ in self.operations)
+
+        self._result = self.source._get_reduced_array(reduced_axes, values, relative=relative)
+
+        return self._result
+
+    @property
+    def x_table(self) -> Table:
+        """Returns the x_table of the computed Array."""
+        return self.compute().x_table
+
+    @property
+    def y(self) -> BaseUnit:
+        """Returns the y unit of the computed Array."""
+        return self.compute().y
+
+    @property
+    def values(self) -> numpy.ndarray:
+        """Returns the y values of the computed Array."""
+        return self.compute().y.values
+
+    @property
+    def shape(self) -> tuple:
+        """Returns the shape of the computed y values."""
+        return self.compute().shape
+
+    def plot(self, *args, **kwargs) -> NoReturn:
+        """Computes the recorded operations and plots the resulting Array, see `Array.plot`."""
+        return self.compute().plot(*args, **kwargs)
+
+# -
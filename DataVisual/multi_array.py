@@ -1,16 +1,27 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from copy import deepcopy
-
 import numpy
 from dataclasses import dataclass
-from typing import Any, Callable, NoReturn
+from io import BytesIO
+from concurrent.futures import Executor
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, ClassVar, Iterable, NoReturn
+import matplotlib
 import matplotlib.pyplot as plt
+from matplotlib.artist import Artist
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+from matplotlib.patches import Patch
 import MPSPlots
 
+from DataVisual import downsampling, statistics, storage, sweep
+from DataVisual.lazy import LazyArray
+from DataVisual.shared import SharedArray
 from DataVisual.tables import Table
-from DataVisual.units import BaseUnit
+from DataVisual.units import BaseUnit, Custom
 
 
 @dataclass
@@ -23,30 +34,208 @@ class Array:
     x_table : Table
         A table representing the X dimensions.
     y : Any
-        An object representing the Y dimensions, expected to have a `values` attribute.
+        An object representing the Y dimensions, expected to have a `base_values` attribute.
+    batch_threshold : int
+        Number of curves above which line plots are drawn as a single LineCollection.
+    max_legend_entries : int
+        Maximum number of labeled curves in the legend of a batched line plot.
+    colormap : str
+        Colormap used to color the curves of a batched line plot.
+    canvas_lock : Lock
+        Lock serializing the text layout of `render` and `to_png`, matplotlib's mathtext parser being shared.
     """
 
     x_table: Table
     y: Any
 
+    batch_threshold: ClassVar[int] = 50
+    max_legend_entries: ClassVar[int] = 10
+    colormap: ClassVar[str] = 'viridis'
+    canvas_lock: ClassVar[Lock] = Lock()
+
     def __post_init__(self):
         """Post-initialization to validate the attributes."""
         self._validate_attributes()
 
     def _validate_attributes(self):
-        """Ensures that the 'y' attribute has a 'values' attribute."""
-        if not hasattr(self.y, 'values'):
-            raise ValueError("The 'y' attribute must have a 'values' attribute.")
+        """Ensures that the 'y' attribute has a 'base_values' attribute, without computing its scaled values."""
+        if not hasattr(self.y, 'base_values'):
+            raise ValueError("The 'y' attribute must have a 'base_values' attribute.")
+
+    def __reduce_ex__(self, protocol: int) -> tuple:
+        """
+        Pickles the Array by its x_table and y unit only.
+
+        The units pickle their base values as out-of-band buffers with protocol 5 and leave out their derived
+        arrays, see `BaseUnit.__reduce_ex__`, and the Table its label and identity indexes.
+
+        Args:
+            protocol (int): The pickle protocol.
+
+        Returns:
+            tuple: The class and its constructor arguments.
+        """
+        return type(self), (self.x_table, self.y)
 
     @property
     def shape(self) -> tuple:
         """Returns the shape of the y values."""
-        return self.y.values.shape
+        return self.y.base_values.shape
+
+    @classmethod
+    def from_memmap(
+            cls,
+            filename: str | Path,
+            x_table: Table,
+            y: BaseUnit,
+            dtype: numpy.dtype = numpy.float64,
+            mode: str = 'r',
+            offset: int = 0) -> 'Array':
+        """
+        Creates an Array whose y values live in a memory-mapped file instead of in memory.
+
+        The shape of the file is given by the sizes of the x_table parameters. Reductions on such an
+        Array (mean, std, rsd, stats) are computed chunk by chunk, so the file may be larger than memory.
+
+        Args:
+            filename (str | Path): The raw binary file holding the y values in C order.
+            x_table (Table): The table of the X dimensions.
+            y (BaseUnit): The unit of the Y dimension, its base values are replaced by the memory-mapped ones.
+            dtype (numpy.dtype, optional): The data type of the file. Default is float64.
+            mode (str, optional): The numpy.memmap file mode, 'w+' creates the file. Default is 'r'.
+            offset (int, optional): The offset, in bytes, of the values in the file. Default is 0.
+
+        Returns:
+            Array: The new memory-mapped Array instance.
+        """
+        shape = tuple(x.size for x in x_table)
+
+        values = numpy.memmap(filename, dtype=dtype, mode=mode, offset=offset, shape=shape)
+
+        return cls(x_table=x_table, y=y.clone(base_values=values))
+
+    @classmethod
+    def from_shared(cls, shared: SharedArray, copy: bool = True) -> 'Array':
+        """
+        Creates an Array from the y values filled in a SharedArray, e.g. by worker processes.
+
+        Args:
+            shared (SharedArray): The SharedArray, created with the unit of the Y dimension.
+            copy (bool, optional): If True, the y values are copied out of the shared memory block. Otherwise
+                they are a view of the block, which keeps it mapped in this process, even once the SharedArray is
+                closed and the block unlinked, until the Array is garbage collected. Default is True.
+
+        Returns:
+            Array: The new Array instance.
+        """
+        values = shared.values.copy() if copy else shared.values
+
+        return cls(x_table=shared.x_table, y=shared.y.clone(base_values=values))
+
+    @classmethod
+    def from_function(
+            cls,
+            func: Callable,
+            x_table: Table,
+            y: BaseUnit,
+            vectorized: bool = None,
+            executor: Executor = None,
+            chunk_size: int = None,
+            dtype: numpy.dtype = numpy.float64,
+            cache: sweep.SweepCache = None,
+            cache_key: str = None) -> 'Array':
+        """
+        Creates an Array by evaluating a function over the Cartesian product of the x_table parameters.
+
+        The function takes the values of the parameters, in the order of the x_table, and returns the y value.
+        If it accepts broadcast arrays the whole grid is evaluated in a single call, otherwise the grid is
+        evaluated point by point in chunks mapped over an executor. Either way the results are written
+        straight into a preallocated y buffer.
+
+        Args:
+            func (Callable): The function to evaluate. With the default process pool it must be picklable,
+                e.g. defined at the top level of a module.
+            x_table (Table): The table of the X dimensions.
+            y (BaseUnit): The unit of the Y dimension, its base values are replaced by the evaluated ones.
+            vectorized (bool, optional): Whether the function accepts broadcast arrays. Default is to try a single
+                call over the whole grid first, falling back to the point by point evaluation if it fails; pass
+                False for scalar-only functions with side effects.
+            executor (Executor, optional): The executor of the point by point evaluation. Default is a new process pool.
+            chunk_size (int, optional): The number of points per chunk of the point by point evaluation.
+                Default is about four chunks per processor.
+            dtype (numpy.dtype, optional): The data type of the y values. Default is float64.
+            cache (SweepCache, optional): The cache of the results, only the points missing from it are evaluated.
+                Default is no cache.
+            cache_key (str, optional): An explicit key identifying the function in the cache, for functions whose
+                behaviour depends on state which can not be hashed. Default is to hash the function.
+
+        Returns:
+            Array: The new Array instance.
+        """
+        values = numpy.empty(x_table.shape, dtype=dtype)
+        kwargs = dict(vectorized=vectorized, executor=executor, chunk_size=chunk_size)
+
+        if cache is None:
+            sweep.evaluate(func, x_table, out=values, **kwargs)
+        else:
+            cache.evaluate(func, x_table, out=values, key=cache_key, **kwargs)
+
+        return cls(x_table=x_table, y=y.clone(base_values=values))
+
+    def _get_axes(self, axis: BaseUnit | str | Iterable[BaseUnit | str]) -> tuple[BaseUnit, ...]:
+        """
+        Returns the reduction axes as a tuple, whether a single axis or several were provided.
+
+        Args:
+            axis (BaseUnit | str | Iterable[BaseUnit | str]): The axis or axes of the x_table, or their labels.
+
+        Returns:
+            tuple[BaseUnit, ...]: The axes.
+        """
+        axes = (axis,) if isinstance(axis, (BaseUnit, str)) else tuple(axis)
+
+        return tuple(self.x_table[x] if isinstance(x, str) else x for x in axes)
+
+    def _get_reduced_array(
+            self,
+            axes: tuple[BaseUnit, ...],
+            base_values: numpy.ndarray,
+            relative: bool = False) -> 'Array':
+        """
+        Wraps values reduced along the given axes into a new Array instance.
+
+        Args:
+            axes (tuple[BaseUnit, ...]): The axes that were reduced.
+            base_values (numpy.ndarray): The reduced values.
+            relative (bool, optional): Whether the values are relative, such as an RSD, so they are given a
+                dimensionless unit without SI prefix rather than the unit of y. Default is False.
+
+        Returns:
+            Array: A new Array instance whose x_table no longer contains the reduced axes.
+        """
+        x_table = [x for x in self.x_table if x not in axes]
+        x_table = Table(x_table)
+
+        if relative:
+            new_y = Custom(
+                long_label=f'RSD of {self.y.long_label}',
+                short_label=f'rsd_{self.y.short_label}',
+                string_format=self.y.string_format,
+                use_prefix=False,
+                base_values=base_values
+            )
+        else:
+            new_y = self.y.clone(base_values=base_values)
+
+        return Array(x_table=x_table, y=new_y)
 
     @staticmethod
     def generate_y_copy(operation: Callable) -> Callable:
         """
-        Decorator to generate a modified copy of 'y' for operations like mean, std, and rsd.
+        Decorator to generate a modified copy of 'y' for operations like mean and std.
+
+        The decorated operation receives the positions of the reduction axes as a tuple, and the number
+        of threads of the reduction.
 
         Args:
             operation (Callable): The operation to perform on 'y'.
@@ -55,63 +244,234 @@ class Array:
             Callable: A wrapper function that applies the operation and returns a new Array instance.
         """
 
-        def wrapper(self, axis):
-            new_y = deepcopy(self.y)
-
-            x_table = [x for x in self.x_table if x != axis]
-            x_table = Table(x_table)
-
-            new_values = operation(self, axis=axis)
+        def wrapper(self, axis, workers: int = None):
+            axes = self._get_axes(axis)
 
-            new_y.values = new_values
+            new_values = operation(self, axis=tuple(self.x_table.get_position(x) for x in axes), workers=workers)
 
-            return Array(x_table=x_table, y=new_y)
+            return self._get_reduced_array(axes, new_values)
 
         return wrapper
 
     @generate_y_copy
-    def mean(self, axis: str) -> numpy.ndarray:
+    def mean(self, axis: BaseUnit | Iterable[BaseUnit], workers: int = None) -> numpy.ndarray:
         """
         Computes the mean along the specified axis and returns a new Array instance.
 
         Args:
-            axis (str): The axis along which to compute the mean.
+            axis (BaseUnit | Iterable[BaseUnit]): The axis, or axes, along which to compute the mean.
+            workers (int, optional): The number of threads reducing chunks of the array, see `statistics.reduce`.
+                Default is `statistics.default_workers`.
 
         Returns:
             Array: A new Array instance containing the mean values along the specified axis.
         """
-        return numpy.mean(self.y.values, axis=axis.position)
+        return statistics.reduce('mean', self.y.base_values, axis=axis, workers=workers)
 
     @generate_y_copy
-    def std(self, axis: str) -> numpy.ndarray:
+    def std(self, axis: BaseUnit | Iterable[BaseUnit], workers: int = None) -> numpy.ndarray:
         """
         Computes the standard deviation along the specified axis and returns a new Array instance.
 
         Args:
-            axis (str): The axis along which to compute the standard deviation.
+            axis (BaseUnit | Iterable[BaseUnit]): The axis, or axes, along which to compute the standard deviation.
+            workers (int, optional): The number of threads reducing chunks of the array. Default is `statistics.default_workers`.
 
         Returns:
             Array: A new Array instance containing the standard deviation values along the specified axis.
         """
-        return numpy.std(self.y.values, axis=axis.position)
+        return statistics.reduce('std', self.y.base_values, axis=axis, workers=workers)
 
-    @generate_y_copy
-    def rsd(self, axis: str) -> numpy.ndarray:
+    def rsd(self, axis: BaseUnit | Iterable[BaseUnit], workers: int = None) -> 'Array':
         """
         Computes the relative standard deviation (RSD) along the specified axis.
 
-        RSD is defined as the standard deviation divided by the mean.
+        RSD is defined as the standard deviation divided by the mean, its y unit is dimensionless.
 
         Args:
-            axis (str): The axis along which to compute the RSD.
+            axis (BaseUnit | Iterable[BaseUnit]): The axis, or axes, along which to compute the RSD.
+            workers (int, optional): The number of threads reducing chunks of the array. Default is `statistics.default_workers`.
 
         Returns:
             Array: A new Array instance containing the RSD values along the specified axis.
         """
-        std = numpy.std(self.y.values, axis=axis.position)
-        mean = numpy.mean(self.y.values, axis=axis.position)
+        axes = self._get_axes(axis)
+
+        positions = tuple(self.x_table.get_position(x) for x in axes)
+
+        values = statistics.reduce('rsd', self.y.base_values, axis=positions, workers=workers)
+
+        return self._get_reduced_array(axes, values, relative=True)
+
+    def stats(self, axis: BaseUnit | Iterable[BaseUnit], workers: int = None) -> tuple['Array', 'Array', 'Array']:
+        """
+        Computes the mean, standard deviation and RSD along the specified axis in a single reduction.
+
+        Args:
+            axis (BaseUnit | Iterable[BaseUnit]): The axis, or axes, along which to compute the statistics.
+            workers (int, optional): The number of threads reducing chunks of the array. Default is `statistics.default_workers`.
+
+        Returns:
+            tuple[Array, Array, Array]: New Array instances containing the mean, standard deviation and RSD values.
+        """
+        axes = self._get_axes(axis)
+
+        positions = tuple(self.x_table.get_position(x) for x in axes)
+
+        mean, std = statistics.reduce('mean_and_std', self.y.base_values, axis=positions, workers=workers)
+
+        return (
+            self._get_reduced_array(axes, mean),
+            self._get_reduced_array(axes, std),
+            self._get_reduced_array(axes, std / mean, relative=True)
+        )
+
+    def quantile(
+            self,
+            axis: BaseUnit | Iterable[BaseUnit],
+            q: float | Iterable[float]) -> 'Array | tuple[Array, ...]':
+        """
+        Computes one or several quantiles along the specified axis in a single partial sort.
+
+        Args:
+            axis (BaseUnit | Iterable[BaseUnit]): The axis, or axes, along which to compute the quantiles.
+            q (float | Iterable[float]): The quantile, or quantiles, between 0 and 1.
+
+        Returns:
+            Array | tuple[Array, ...]: A new Array instance containing the quantile values, or one per quantile if q is a sequence.
+        """
+        axes = self._get_axes(axis)
+
+        positions = tuple(self.x_table.get_position(x) for x in axes)
+
+        q = q if numpy.ndim(q) == 0 else tuple(q)
+
+        values = statistics.quantile(self.y.base_values, axis=positions, q=q)
+
+        if numpy.ndim(q) == 0:
+            return self._get_reduced_array(axes, values)
+
+        return tuple(self._get_reduced_array(axes, quantile_values) for quantile_values in values)
+
+    def isel(self, indexers: dict[BaseUnit | str, int | slice] = None, **indexers_kwargs) -> 'Array':
+        """
+        Selects a subset of the Array by integer index or slice along some axes.
+
+        The y values of the new Array are a view of the original ones. Axes selected by an integer are
+        dropped from the x_table, axes selected by a slice are sliced.
+
+        Args:
+            indexers (dict[BaseUnit | str, int | slice], optional): The selection, keyed by x_table unit or unit label.
+            **indexers_kwargs: The selection, keyed by unit label, for labels that are valid keyword names.
+
+        Returns:
+            Array: The selected Array instance.
+
+        Raises:
+            TypeError: If an indexer is neither an integer nor a slice, such as a list or an array.
+        """
+        selection = self.x_table.get_selection({**(indexers or {}), **indexers_kwargs})
+
+        new_y = self.y.clone(base_values=self.y.base_values[tuple(selection)])
+
+        return Array(x_table=self.x_table.select(selection), y=new_y)
+
+    def sel(
+            self,
+            indexers: dict[BaseUnit | str, float | slice] = None,
+            method: str | None = 'nearest',
+            **indexers_kwargs) -> 'Array':
+        """
+        Selects a subset of the Array by value along some axes, see `BaseUnit.get_index`.
+
+        The values are looked up by binary search in the base values of each axis, then the selection
+        is made by `isel`, so the y values of the new Array are a view of the original ones.
+
+        Args:
+            indexers (dict[BaseUnit | str, float | slice], optional): The values, or slices of values, keyed by
+                x_table unit or unit label.
+            method (str, optional): 'nearest' selects the closest values, None requires exact matches. Default is 'nearest'.
+            **indexers_kwargs: The values, keyed by unit label, for labels that are valid keyword names.
+
+        Returns:
+            Array: The selected Array instance.
+        """
+        indexers = {**(indexers or {}), **indexers_kwargs}
+
+        return self.isel({
+            axis: self._get_axes(axis)[0].get_index(value, method=method) for axis, value in indexers.items()
+        })
+
+    def save(self, path: str | Path) -> Path:
+        """
+        Saves the Array to a directory as raw .npy buffers plus a small JSON header, see `storage.save`.
+
+        Args:
+            path (str | Path): The directory to write, created if needed.
+
+        Returns:
+            Path: The directory written.
+        """
+        return storage.save(self, path)
+
+    def save_chunked(
+            self,
+            path: str | Path,
+            chunk_shape: tuple[int, ...] | None = None,
+            compression: str | None = 'zlib') -> Path:
+        """
+        Saves the Array to a directory with its y values split in independently compressed chunks,
+        see `storage.save_chunked`.
 
-        return std / mean
+        Args:
+            path (str | Path): The directory to write, created if needed.
+            chunk_shape (tuple[int, ...], optional): The shape of the chunks. Default is about 1 MiB per chunk.
+            compression (str, optional): The compression of the chunks, 'zlib', 'lzma' or None. Default is 'zlib'.
+
+        Returns:
+            Path: The directory written.
+        """
+        return storage.save_chunked(self, path, chunk_shape=chunk_shape, compression=compression)
+
+    @classmethod
+    def open_chunked(cls, path: str | Path) -> storage.ChunkedStore:
+        """
+        Opens an Array saved with `save_chunked` without reading its values.
+
+        Selections made with `ChunkedStore.isel` only decompress the chunks they touch.
+
+        Args:
+            path (str | Path): The directory to read.
+
+        Returns:
+            ChunkedStore: The opened store.
+        """
+        return storage.ChunkedStore(path, array_class=cls)
+
+    @classmethod
+    def load(cls, path: str | Path, mmap: bool = True) -> 'Array':
+        """
+        Loads an Array saved with `save`, or entirely read one saved with `save_chunked`.
+
+        Args:
+            path (str | Path): The directory to read.
+            mmap (bool, optional): If True, the y values are memory-mapped read-only instead of read. Default is True.
+
+        Returns:
+            Array: The loaded Array instance.
+        """
+        x_table, y = storage.load(path, mmap=mmap)
+
+        return cls(x_table=x_table, y=y)
+
+    def lazy(self) -> LazyArray:
+        """
+        Returns a lazy view of the Array on which mean, std and rsd are deferred until computed.
+
+        Returns:
+            LazyArray: The lazy view of this Array.
+        """
+        return LazyArray(source=self)
 
     def _normalize(self, values: numpy.ndarray) -> numpy.ndarray:
         """
@@ -123,7 +483,9 @@ class Array:
         Returns:
             np.ndarray: The normalized values.
         """
-        return (values - numpy.mean(values)) / numpy.std(values)
+        summary = statistics.summarize(values)
+
+        return (values - summary.mean) / summary.std
 
     def plot(
             self,
@@ -131,6 +493,10 @@ class Array:
             normalize: bool = False,
             std: BaseUnit = None,
             add_box: bool = False,
+            batched: bool = None,
+            downsample: str = None,
+            band: str = 'std',
+            quantiles: tuple[float, float, float] = (0.05, 0.5, 0.95),
             **kwargs) -> NoReturn:
         """
         Generates a plot of the data with options for normalization, adding standard deviation, and more.
@@ -139,42 +505,37 @@ class Array:
         adds standard deviation shading, and includes additional information in a box.
 
         Args:
-            x (BaseUnit): The parameter for the x-axis.
+            x (BaseUnit | str): The parameter for the x-axis, or its label.
             normalize (bool, optional): If True, normalizes the y data. Default is False.
-            std (BaseUnit, optional): The parameter for standard deviation. Default is None.
+            std (BaseUnit | str, optional): The parameter for standard deviation, or its label. Default is None.
             add_box (bool, optional): If True, adds a box with additional information to the plot. Default is False.
+            batched (bool, optional): If True, draws all the curves as a single LineCollection. Default is
+                automatic, batching above `batch_threshold` curves.
+            downsample (str, optional): Decimates long curves to the figure width with the 'minmax' or 'lttb'
+                method. Default is no decimation.
+            band (str, optional): The shading along the std parameter, 'std' for the mean with a band of one
+                standard deviation, or 'quantile' for the median with a band between two quantiles. Default is 'std'.
+            quantiles (tuple[float, float, float], optional): The lower, central and upper quantiles of the
+                'quantile' band. Default is (0.05, 0.5, 0.95).
             **kwargs: Additional keyword arguments passed to the plotting functions.
 
         Returns:
             NoReturn: This method modifies the plot in place and displays it, but does not return a value.
         """
         with plt.style.context(MPSPlots.styles.mps):
-            # Deep copy the y data to avoid modifying the original
-            y = deepcopy(self.y)
-            x.is_base = True
-
             # Create a figure and axis for plotting
             figure, ax = plt.subplots()
 
-            # Normalize the y data if specified
-            if normalize:
-                y.normalized = True
-
-            # Generate x and y axis labels
-            y_label = y.get_representation(use_prefix=True, add_unit=True)
-            x_label = x.get_representation(use_prefix=True, add_unit=True)
-
-            # Set axis labels
-            ax.set(xlabel=x_label, ylabel=y_label)
-
-            # Plot the data with or without standard deviation
-            if std is not None:
-                self.add_std_line_to_ax(ax=ax, x=x, y=y, std=std)
-            else:
-                self.add_line_plot_to_ax(ax=ax, x=x, y=y)
-
-            # Optionally add a legend
-            ax.legend()
+            self.draw(
+                ax=ax,
+                x=x,
+                normalize=normalize,
+                std=std,
+                batched=batched,
+                downsample=downsample,
+                band=band,
+                quantiles=quantiles
+            )
 
             # Adjust layout for better spacing
             plt.tight_layout()
@@ -182,6 +543,131 @@ class Array:
             # Display the plot
             plt.show()
 
+    def draw(
+            self,
+            ax: plt.Axes,
+            x: BaseUnit | str,
+            normalize: bool = False,
+            std: BaseUnit | str = None,
+            batched: bool = None,
+            downsample: str = None,
+            band: str = 'std',
+            quantiles: tuple[float, float, float] = (0.05, 0.5, 0.95)) -> NoReturn:
+        """
+        Draws the data on the given axis, with its axis labels and legend, without creating or showing a figure.
+
+        This is the drawing step of `plot`, it can be used to draw on a figure managed by the caller.
+
+        Args:
+            ax (Axes): The matplotlib axis to draw on.
+            x (BaseUnit | str): The parameter for the x-axis, or its label.
+            normalize (bool, optional): If True, normalizes the y data. Default is False.
+            std (BaseUnit | str, optional): The parameter for standard deviation, or its label. Default is None.
+            batched (bool, optional): If True, draws all the curves as a single LineCollection. Default is automatic.
+            downsample (str, optional): Decimates long curves with the 'minmax' or 'lttb' method. Default is None.
+            band (str, optional): The shading along the std parameter, 'std' or 'quantile'. Default is 'std'.
+            quantiles (tuple[float, float, float], optional): The lower, central and upper quantiles of the
+                'quantile' band. Default is (0.05, 0.5, 0.95).
+
+        Returns:
+            NoReturn: This method modifies the ax in place and does not return any value.
+        """
+        x = self.x_table[x] if isinstance(x, str) else x
+        std = self.x_table[std] if isinstance(std, str) else std
+
+        # Normalize a metadata-only copy of the y data to avoid modifying the original
+        y = self.y.clone(normalized=True) if normalize else self.y
+
+        # Generate x and y axis labels
+        y_label = y.get_representation(use_prefix=True, add_unit=True)
+        x_label = x.get_representation(use_prefix=True, add_unit=True)
+
+        # Set axis labels
+        ax.set(xlabel=x_label, ylabel=y_label)
+
+        # Plot the data with or without standard deviation, then add a legend
+        if std is not None and band == 'quantile':
+            handles = self.add_quantile_line_to_ax(ax=ax, x=x, y=y, axis=std, quantiles=quantiles)
+        elif std is not None:
+            handles = self.add_std_line_to_ax(ax=ax, x=x, y=y, std=std)
+        else:
+            handles = self.add_line_plot_to_ax(ax=ax, x=x, y=y, batched=batched, downsample=downsample)
+
+        ax.legend(handles=handles)
+
+    def render(
+            self,
+            x: BaseUnit | str,
+            normalize: bool = False,
+            std: BaseUnit | str = None,
+            batched: bool = None,
+            downsample: str = None,
+            band: str = 'std',
+            quantiles: tuple[float, float, float] = (0.05, 0.5, 0.95),
+            figsize: tuple[float, float] = None,
+            dpi: float = None) -> Figure:
+        """
+        Renders the data on a new Figure, without pyplot and without modifying the units.
+
+        Unlike `plot`, no pyplot figure manager nor style context is involved, so concurrent calls from
+        several threads are safe: the data are prepared and drawn concurrently, and only the text layout
+        is serialized by `canvas_lock`. The style is taken from the current rcParams, which are global to
+        the process: apply it once beforehand, e.g. with `plt.style.use(MPSPlots.styles.mps)`.
+
+        Args:
+            x (BaseUnit | str): The parameter for the x-axis, or its label.
+            normalize (bool, optional): If True, normalizes the y data. Default is False.
+            std (BaseUnit | str, optional): The parameter for standard deviation, or its label. Default is None.
+            batched (bool, optional): If True, draws all the curves as a single LineCollection. Default is automatic.
+            downsample (str, optional): Decimates long curves with the 'minmax' or 'lttb' method. Default is None.
+            band (str, optional): The shading along the std parameter, 'std' or 'quantile'. Default is 'std'.
+            quantiles (tuple[float, float, float], optional): The lower, central and upper quantiles of the
+                'quantile' band. Default is (0.05, 0.5, 0.95).
+            figsize (tuple[float, float], optional): The size of the figure in inches. Default is the rcParams one.
+            dpi (float, optional): The resolution of the figure. Default is the rcParams one.
+
+        Returns:
+            Figure: The rendered figure, not attached to pyplot.
+        """
+        figure = Figure(figsize=figsize, dpi=dpi)
+        ax = figure.subplots()
+
+        self.draw(
+            ax=ax,
+            x=x,
+            normalize=normalize,
+            std=std,
+            batched=batched,
+            downsample=downsample,
+            band=band,
+            quantiles=quantiles
+        )
+
+        with self.canvas_lock:
+            figure.tight_layout()
+
+        return figure
+
+    def to_png(self, x: BaseUnit | str, dpi: float = None, **kwargs) -> bytes:
+        """
+        Renders the data to PNG bytes, see `render` for the thread-safety of this method.
+
+        Args:
+            x (BaseUnit | str): The parameter for the x-axis, or its label.
+            dpi (float, optional): The resolution of the image. Default is the rcParams one.
+            **kwargs: Additional keyword arguments passed to `render`.
+
+        Returns:
+            bytes: The content of the PNG image.
+        """
+        figure = self.render(x=x, dpi=dpi, **kwargs)
+
+        buffer = BytesIO()
+        with self.canvas_lock:
+            figure.savefig(buffer, format='png', dpi=dpi)
+
+        return buffer.getvalue()
+
     def get_diff_label(self, slicer: tuple) -> str:
         """
         Generates a label for a plot based on the parameters and their values,
@@ -217,47 +703,126 @@ class Array:
 
         return label.strip()  # Remove any leading/trailing whitespace or slashes
 
-    def add_line_plot_to_ax(self, ax: plt.Axes, x: BaseUnit, y: BaseUnit, **kwargs) -> NoReturn:
+    def add_line_plot_to_ax(
+            self,
+            ax: plt.Axes,
+            x: BaseUnit,
+            y: BaseUnit,
+            batched: bool = None,
+            downsample: str = None,
+            **kwargs) -> list[Artist]:
         """
         Adds a line plot to the given axis using the provided x and y data.
 
-        This method handles multi-dimensional arrays by iterating over all non-x dimensions.
-        Each slice of the y array along these dimensions will be plotted against the x values.
+        This method handles multi-dimensional arrays by plotting every slice of the y array
+        along the non-x dimensions against the x values. Above `batch_threshold` curves, all
+        the slices are drawn as a single LineCollection colored from `colormap`.
 
         Args:
             ax (Axes): The matplotlib axis where the line plot will be added.
             x (Any): The x-axis data, represented as a BaseUnit object.
             y (Any): The y-axis data, represented as a BaseUnit object.
+            batched (bool, optional): Forces the batched (True) or per-line (False) rendering. Default is automatic.
+            downsample (str, optional): Decimates the curves to about two points per pixel column of the axis
+                with the 'minmax' or 'lttb' method, see `DataVisual.downsampling`. Default is no decimation.
             **kwargs: Additional keyword arguments passed to the plot method.
 
         Returns:
-            NoReturn: This method modifies the ax in place and does not return any value.
+            list[Artist]: The legend handles.
         """
-        # Identify non-x dimensions to iterate over
-        dimensions = [dim for dim, size in enumerate(y.values.shape) if dim != x.position]
+        y_data, indices = self._get_curves(y.base_values, x_position=self.x_table.get_position(x))
+        labels = self.get_curve_labels(indices)
 
-        # Iterate over multi-dimensional y array
-        _, index = numpy.nested_iters(y.values, [[], dimensions], flags=["multi_index"])
+        if downsample is not None:
+            n_out = 2 * int(ax.get_window_extent().width)
+            x_data, y_data = downsampling.downsample(x.values, y_data, method=downsample, n_out=n_out)
+        else:
+            x_data = numpy.broadcast_to(x.values, y_data.shape)
 
-        for _ in index:
-            slicer = list(index.multi_index)
-            slicer.insert(x.position, slice(None))  # Insert full slice for x dimension
+        # Scale only the curves being drawn, rather than caching the scaled copy of the whole y array
+        y_data = y_data * y.scale_factor
 
-            label = self.get_diff_label(slicer=tuple(slicer))
+        if batched is None:
+            batched = len(labels) > self.batch_threshold
 
-            y_data = y.values[tuple(slicer)].squeeze()
-            x_data = x.values
+        if batched:
+            return self._add_line_collection_to_ax(
+                ax=ax, x=x, y=y, x_data=x_data, y_data=y_data, labels=labels, **kwargs
+            )
 
+        for label, x_curve, y_curve in zip(labels, x_data, y_data):
             # Plot the data
-            ax.plot(x_data, y_data, label=label, linewidth=2, **kwargs)
+            ax.plot(x_curve, y_curve, label=label, linewidth=2, **kwargs)
+
+        handles, _ = ax.get_legend_handles_labels()
 
-    def add_std_line_to_ax(self, ax: plt.Axes, x: BaseUnit, y: BaseUnit, std: BaseUnit) -> NoReturn:
+        return handles
+
+    def _add_line_collection_to_ax(
+            self,
+            ax: plt.Axes,
+            x: BaseUnit,
+            y: BaseUnit,
+            x_data: numpy.ndarray,
+            y_data: numpy.ndarray,
+            labels: numpy.ndarray,
+            **kwargs) -> list[Artist]:
+        """
+        Adds all the curves to the given axis as a single LineCollection.
+
+        The legend is kept compact: at most `max_legend_entries` curves, evenly spread over
+        the colormap, are labeled, followed by an entry giving the total number of curves.
+
+        Args:
+            ax (Axes): The matplotlib axis where the line collection will be added.
+            x (BaseUnit): The x-axis data, represented as a BaseUnit object.
+            y (BaseUnit): The y-axis data, represented as a BaseUnit object.
+            x_data (numpy.ndarray): The x values of the curves, as a (n_curves, n_points) array.
+            y_data (numpy.ndarray): The curves, as a (n_curves, n_points) array.
+            labels (numpy.ndarray): The label of each curve.
+            **kwargs: Additional keyword arguments passed to the LineCollection.
+
+        Returns:
+            list[Artist]: The legend handles.
+        """
+        n_curves = len(labels)
+        colors = matplotlib.colormaps[self.colormap](numpy.linspace(0, 1, n_curves))
+
+        lines = LineCollection(
+            numpy.stack([x_data, y_data], axis=-1),
+            colors=colors,
+            linewidths=kwargs.pop('linewidth', 2),
+            **kwargs
+        )
+
+        # The data limits come from the cached summaries rather than from a scan of every segment
+        limits = self._get_data_limits(x=x, y=y)
+        ax.add_collection(lines, autolim=limits is None)
+
+        if limits is not None:
+            ax.update_datalim(limits)
+
+        ax.autoscale_view()
+
+        indices = numpy.unique(numpy.linspace(0, n_curves - 1, min(n_curves, self.max_legend_entries)).astype(int))
+
+        handles = []
+        for idx in indices:
+            if labels[idx]:
+                handles.append(Line2D([], [], color=colors[idx], linewidth=2, label=labels[idx]))
+
+        if handles and len(indices) < n_curves:
+            handles.append(Line2D([], [], linestyle='none', label=f"({n_curves} curves)"))
+
+        return handles
+
+    def add_std_line_to_ax(self, ax: plt.Axes, x: BaseUnit, y: BaseUnit, std: BaseUnit) -> list[Artist]:
         """
         Adds a line plot with standard deviation shading to the given axis.
 
         This method plots the mean of the y data with shaded areas representing
-        the standard deviation. It handles multi-dimensional arrays by iterating
-        over all non-x and non-std dimensions.
+        the standard deviation. The mean and standard deviation are computed once over
+        the whole array, then drawn by `_add_band_to_ax`.
 
         Args:
             ax (Axes): The matplotlib axis where the line plot will be added.
@@ -266,40 +831,207 @@ class Array:
             std (Any): The standard deviation data, represented as a BaseUnit object.
 
         Returns:
-            NoReturn: This method modifies the ax in place and does not return any value.
+            list[Artist]: The legend handles, one per labeled curve.
         """
-        std.is_base = True
-        # Identify non-x and non-std dimensions to iterate over
-        dimensions = [dim for dim, size in enumerate(y.values.shape) if dim not in [x.position, std.position]]
+        # Compute mean and standard deviation once, keeping the std axis so positions are unchanged
+        y_mean, y_std = statistics.mean_and_std(y.base_values, axis=self.x_table.get_position(std), keepdims=True)
 
-        # Iterate over multi-dimensional y array
-        _, index = numpy.nested_iters(y.values, [[], dimensions], flags=["multi_index"])
+        return self._add_band_to_ax(
+            ax=ax, x=x, y=y, axis=std, center=y_mean, lower=y_mean - y_std / 2, upper=y_mean + y_std / 2
+        )
 
-        for _ in index:
-            slicer = list(index.multi_index)
+    def add_quantile_line_to_ax(
+            self,
+            ax: plt.Axes,
+            x: BaseUnit,
+            y: BaseUnit,
+            axis: BaseUnit,
+            quantiles: tuple[float, float, float] = (0.05, 0.5, 0.95)) -> list[Artist]:
+        """
+        Adds a line plot with quantile shading to the given axis.
 
-            if x.position < std.position:
-                slicer.insert(x.position, slice(None))
-                slicer.insert(std.position, slice(None))
-            else:
-                slicer.insert(std.position, slice(None))
-                slicer.insert(x.position, slice(None))
+        This method plots the central quantile, typically the median, of the y data along the given axis
+        with shaded areas between the lower and upper quantiles. The three quantiles of all the curves are
+        computed in a single partial sort, then drawn by `_add_band_to_ax`.
 
-            label = self.get_diff_label(slicer=tuple(slicer))
+        Args:
+            ax (Axes): The matplotlib axis where the line plot will be added.
+            x (BaseUnit): The x-axis data, represented as a BaseUnit object.
+            y (BaseUnit): The y-axis data, represented as a BaseUnit object.
+            axis (BaseUnit): The parameter along which the quantiles are computed.
+            quantiles (tuple[float, float, float], optional): The lower, central and upper quantiles.
+                Default is (0.05, 0.5, 0.95).
+
+        Returns:
+            list[Artist]: The legend handles, one per labeled curve.
+        """
+        lower, center, upper = statistics.quantile(
+            y.base_values, axis=self.x_table.get_position(axis), q=tuple(quantiles), keepdims=True
+        )
+
+        return self._add_band_to_ax(ax=ax, x=x, y=y, axis=axis, center=center, lower=lower, upper=upper)
+
+    def _add_band_to_ax(
+            self,
+            ax: plt.Axes,
+            x: BaseUnit,
+            y: BaseUnit,
+            axis: BaseUnit,
+            center: numpy.ndarray,
+            lower: numpy.ndarray,
+            upper: numpy.ndarray) -> list[Artist]:
+        """
+        Adds central lines with shaded bands to the given axis, all the bands drawn as a single
+        PolyCollection and all the central lines as a single LineCollection.
+
+        Args:
+            ax (Axes): The matplotlib axis where the bands will be added.
+            x (BaseUnit): The x-axis data, represented as a BaseUnit object.
+            y (BaseUnit): The y-axis data, represented as a BaseUnit object.
+            axis (BaseUnit): The parameter reduced into the bands.
+            center (numpy.ndarray): The base values of the central lines, with the reduced axis kept with size one.
+            lower (numpy.ndarray): The base values of the lower bounds, with the same shape as center.
+            upper (numpy.ndarray): The base values of the upper bounds, with the same shape as center.
+
+        Returns:
+            list[Artist]: The legend handles, one per labeled curve.
+        """
+        x_position, band_position = self.x_table.get_position(x), self.x_table.get_position(axis)
+
+        curves = []
+        for values in (center, lower, upper):
+            values, indices = self._get_curves(values, x_position=x_position, fixed_positions=[band_position])
+            curves.append(values * y.scale_factor)
+
+        y_center, y1, y2 = curves
+        labels = self.get_curve_labels(indices)
+
+        x_data = numpy.broadcast_to(x.values, y_center.shape)
+        colors = self._get_cycle_colors(len(labels))
 
-            # Compute mean and standard deviation
-            y_mean = numpy.mean(y.values, axis=std.position, keepdims=True)
-            y_std = numpy.std(y.values, axis=std.position, keepdims=True)
+        # Each band is the lower bound followed by the reversed upper bound
+        band_x = numpy.concatenate([x_data, x_data[:, ::-1]], axis=1)
+        band_y = numpy.concatenate([y1, y2[:, ::-1]], axis=1)
 
-            y_mean = y_mean[tuple(slicer)].squeeze()
-            y_std = y_std[tuple(slicer)].squeeze()
+        bands = PolyCollection(
+            numpy.stack([band_x, band_y], axis=-1),
+            facecolors=colors,
+            edgecolors='black',
+            alpha=0.5
+        )
+
+        lines = LineCollection(
+            numpy.stack([x_data, y_center], axis=-1),
+            colors=colors,
+            linewidths=1
+        )
+
+        ax.add_collection(bands)
+        ax.add_collection(lines)
+        ax.autoscale_view()
+
+        handles = []
+        for label, color in zip(labels, colors):
+            if label:
+                handles.append(Patch(facecolor=color, edgecolor='black', alpha=0.5, label=label))
+
+        return handles
+
+    def _get_curves(
+            self,
+            values: numpy.ndarray,
+            x_position: int,
+            fixed_positions: list[int] = ()) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Reshapes the values into a (n_curves, n_x) array, one row per curve along the x dimension.
+
+        Args:
+            values (numpy.ndarray): The values to reshape, with one dimension per x_table parameter.
+            x_position (int): The position of the x dimension.
+            fixed_positions (list[int], optional): Dimensions of size one that are selected entirely by every curve.
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray]: The curves and a (n_curves, n_dimensions) array giving, for
+            each curve, its index along every dimension, -1 for the dimensions it selects entirely.
+        """
+        values = numpy.moveaxis(values, x_position, -1)
+
+        curves = values.reshape(-1, values.shape[-1])
+
+        indices = numpy.indices(values.shape[:-1]).reshape(values.ndim - 1, len(curves)).T
+        indices = numpy.insert(indices, x_position, -1, axis=1)  # Insert full selection for x dimension
+        indices[:, list(fixed_positions)] = -1
+
+        return curves, indices
+
+    def get_curve_labels(self, indices: numpy.ndarray) -> numpy.ndarray:
+        """
+        Generates the labels of many curves at once, equivalent to calling `get_diff_label` for each of them.
 
-            # Compute upper and lower bounds for shading
-            y1 = y_mean - y_std / 2
-            y2 = y_mean + y_std / 2
+        The formatted values of each parameter are precomputed once by `BaseUnit.get_representations`,
+        so the labels are assembled by indexing these arrays instead of formatting values curve by curve.
+
+        Args:
+            indices (numpy.ndarray): A (n_curves, n_dimensions) array giving, for each curve, its index along
+                every dimension, -1 for the dimensions it selects entirely.
+
+        Returns:
+            numpy.ndarray: The labels of the curves, as an array of strings.
+        """
+        labels = numpy.full(len(indices), '', dtype=object)
+
+        for position, x_parameter in enumerate(self.x_table):
+            column = indices[:, position]
+
+            # Skip parameters with only one value or when the entire dimension is selected
+            if x_parameter.size == 1 or numpy.all(column < 0):
+                continue
+
+            representations = x_parameter.get_representations(
+                use_short_repr=True,
+                use_prefix=True,
+                add_unit=True
+            )
+
+            labels = labels + '/ ' + representations[column]
+
+        return labels
+
+    @staticmethod
+    def _get_data_limits(x: BaseUnit, y: BaseUnit) -> numpy.ndarray | None:
+        """
+        Returns the data limits of a plot of all the y values against the x values, from the cached unit summaries.
+
+        Args:
+            x (BaseUnit): The x-axis data, represented as a BaseUnit object.
+            y (BaseUnit): The y-axis data, represented as a BaseUnit object.
+
+        Returns:
+            numpy.ndarray | None: The [[x_min, y_min], [x_max, y_max]] corners, or None if a unit has no finite value.
+        """
+        corners = numpy.array([
+            [x.summary.minimum * x.scale_factor, y.summary.minimum * y.scale_factor],
+            [x.summary.maximum * x.scale_factor, y.summary.maximum * y.scale_factor],
+        ])
+
+        if not numpy.all(numpy.isfinite(corners)):
+            return None
+
+        return corners
+
+    @staticmethod
+    def _get_cycle_colors(n_colors: int) -> list:
+        """
+        Returns the first n colors of the current matplotlib property cycle, repeated if needed.
+
+        Args:
+            n_colors (int): The number of colors to return.
+
+        Returns:
+            list: The colors.
+        """
+        cycle = plt.rcParams['axes.prop_cycle'].by_key()['color']
 
-            # Plot the shaded area and mean line
-            ax.fill_between(x.values, y1=y1, y2=y2, label=label, alpha=0.5, edgecolor='black')
-            ax.plot(x.values, y_mean, linewidth=1)
+        return [cycle[idx % len(cycle)] for idx in range(n_colors)]
 
 # -
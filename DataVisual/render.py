@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable
+
+import matplotlib
+import matplotlib.pyplot as plt
+import MPSPlots
+
+
+def _initialize_worker() -> None:
+    """Selects the non-interactive Agg backend and applies the MPSPlots style, once per worker process."""
+    matplotlib.use('Agg')
+    plt.style.use(MPSPlots.styles.mps)
+
+
+def _render_one(array, spec: dict, path: Path, dpi: float | None = None) -> Path:
+    """
+    Renders one Array on a new figure and saves it, without going through pyplot.
+
+    Args:
+        array (Array): The Array to draw.
+        spec (dict): The keyword arguments of `Array.render`, the axes given by unit or label.
+        path (Path): The file to write, its suffix gives the image format.
+        dpi (float, optional): The resolution of the image. Default is the figure one.
+
+    Returns:
+        Path: The file written.
+    """
+    figure = array.render(dpi=dpi, **spec)
+    figure.savefig(path, dpi=dpi)
+
+    return path
+
+
+def render_many(
+        arrays: Iterable,
+        specs: dict | Iterable[dict],
+        out_dir: str | Path,
+        workers: int | None = None,
+        file_format: str = 'png',
+        dpi: float | None = None) -> list[Path]:
+    """
+    Renders many Arrays to image files, headless and fanned out over a process pool.
+
+    Each worker process uses the Agg backend with the MPSPlots style applied once, and renders each Array
+    with `Array.render` to a figure which is saved rather than shown.
+
+    Args:
+        arrays (Iterable[Array]): The Arrays to render.
+        specs (dict | Iterable[dict]): The keyword arguments of `Array.render`, either one dict for all the Arrays
+            or one per Array. The axes are best given by label, and an optional 'filename' key names the file.
+        out_dir (str | Path): The directory to write the images to, created if needed.
+        workers (int, optional): The number of worker processes, 1 renders in the current process.
+            Default is the number of processors.
+        file_format (str, optional): The image format of the files without a 'filename'. Default is 'png'.
+        dpi (float, optional): The resolution of the images. Default is the figure one.
+
+    Returns:
+        list[Path]: The files written, in the order of the Arrays.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    arrays = list(arrays)
+    specs = [specs] * len(arrays) if isinstance(specs, dict) else list(specs)
+
+    if len(specs) != len(arrays):
+        raise ValueError(f"Got {len(specs)} specs for {len(arrays)} arrays.")
+
+    tasks = []
+    for idx, (array, spec) in enumerate(zip(arrays, specs)):
+        spec = dict(spec)
+        path = out_dir / spec.pop('filename', f'{idx:05d}.{file_format}')
+        tasks.append((array, spec, path))
+
+    if workers == 1:
+        with plt.style.context(MPSPlots.styles.mps):
+            return [_render_one(array, spec, path, dpi=dpi) for array, spec, path in tasks]
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_initialize_worker) as executor:
+        futures = [executor.submit(_render_one, array, spec, path, dpi) for array, spec, path in tasks]
+
+        return [future.result() for future in futures]
+
+# -
@@ -0,0 +1,223 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import sys
+from dataclasses import dataclass
+from multiprocessing import resource_tracker, shared_memory
+from threading import Lock
+
+import numpy
+
+from DataVisual.tables import Table
+from DataVisual.units import BaseUnit
+
+
+# Serializes the creation of and attachment to blocks, attaching patching the resource tracker before Python 3.13
+tracker_lock = Lock()
+
+
+def create_shared_memory(size: int) -> shared_memory.SharedMemory:
+    """
+    Creates a shared memory block, registered with the resource tracker so it is unlinked if leaked.
+
+    Args:
+        size (int): The size of the block in bytes.
+
+    Returns:
+        shared_memory.SharedMemory: The new block.
+    """
+    with tracker_lock:
+        return shared_memory.SharedMemory(create=True, size=max(1, size))
+
+
+def open_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """
+    Attaches to an existing shared memory block without registering it with the resource tracker.
+
+    The block is owned, and eventually unlinked, by the process which created it: before Python 3.13 an
+    attaching process registers it too, so its resource tracker would unlink the block when it exits, or,
+    when it shares the tracker of the owner, unregistering it again would drop the registration of the owner.
+
+    Args:
+        name (str): The name of the block.
+
+    Returns:
+        shared_memory.SharedMemory: The attached block.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+
+    with tracker_lock:
+        register = resource_tracker.register
+        resource_tracker.register = lambda name, rtype: None
+
+        try:
+            return shared_memory.SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+
+class SharedBuffer:
+    """
+    Exposes a shared memory block to numpy, as the base of the arrays viewing it.
+
+    numpy does not hold a buffer export on the block, so arrays created from `SharedMemory.buf` do not
+    prevent it from being unmapped. Arrays created from this object keep it, and thus the block, alive:
+    the block is only unmapped once the last array viewing it is garbage collected.
+
+    Attributes:
+    -----------
+    memory : shared_memory.SharedMemory
+        The shared memory block.
+    """
+
+    def __init__(self, memory: shared_memory.SharedMemory, shape: tuple, dtype: numpy.dtype):
+        """
+        Args:
+            memory (shared_memory.SharedMemory): The shared memory block.
+            shape (tuple): The shape of the array.
+            dtype (numpy.dtype): The data type of the array.
+        """
+        self.memory = memory
+
+        self.__array_interface__ = {
+            'shape': tuple(shape),
+            'typestr': numpy.dtype(dtype).str,
+            'data': (numpy.frombuffer(memory.buf, dtype=numpy.uint8).ctypes.data, False),
+            'version': 3,
+        }
+
+
+@dataclass(frozen=True)
+class SharedArrayHandle:
+    """
+    Lightweight picklable reference to a SharedArray, sent to worker processes instead of its values.
+
+    Attributes:
+    -----------
+    name : str
+        The name of the shared memory block.
+    shape : tuple
+        The shape of the y values.
+    dtype : str
+        The data type of the y values.
+    x_table : Table
+        The table of the X dimensions.
+    y : BaseUnit
+        The unit of the Y dimension, without its values.
+    """
+
+    name: str
+    shape: tuple
+    dtype: str
+    x_table: Table
+    y: BaseUnit | None = None
+
+    def attach(self) -> 'SharedArray':
+        """
+        Attaches to the shared memory block, typically from a worker process.
+
+        Returns:
+            SharedArray: The attached SharedArray, which does not unlink the block when closed.
+        """
+        return SharedArray(
+            x_table=self.x_table,
+            y=self.y,
+            dtype=self.dtype,
+            memory=open_shared_memory(self.name),
+            shape=self.shape
+        )
+
+
+class SharedArray:
+    """
+    Y values of an Array in a shared memory block, so that worker processes write their results in place
+    rather than sending them back through pipes to be copied again into the final array.
+
+    The process creating the SharedArray owns the block and unlinks it when closed, the worker processes
+    attach to it from its `handle` and write into `values` by index. Both are context managers closing on exit.
+    Closing never unmaps the block while arrays view it: the mapping is released with the last of them.
+
+    Attributes:
+    -----------
+    x_table : Table
+        The table of the X dimensions.
+    y : BaseUnit
+        The unit of the Y dimension, without its values.
+    values : numpy.ndarray
+        The y values, a view of the shared memory block.
+    owner : bool
+        Whether this SharedArray created the block, and unlinks it when closed.
+    """
+
+    def __init__(
+            self,
+            x_table: Table,
+            y: BaseUnit | None = None,
+            dtype: numpy.dtype = numpy.float64,
+            memory: shared_memory.SharedMemory | None = None,
+            shape: tuple | None = None):
+        """
+        Args:
+            x_table (Table): The table of the X dimensions, giving the shape of the values.
+            y (BaseUnit, optional): The unit of the Y dimension, only its metadata is kept. Default is None.
+            dtype (numpy.dtype, optional): The data type of the values. Default is float64.
+            memory (shared_memory.SharedMemory, optional): The block to attach to. Default is to create one.
+            shape (tuple, optional): The shape of the values, such as the number of points of a partial
+                evaluation of the grid. Default is the shape of the x_table.
+        """
+        self.x_table = x_table
+        self.y = y.clone(base_values=numpy.empty(0)) if y is not None else None
+        self.dtype = numpy.dtype(dtype)
+        self.owner = memory is None
+
+        shape = x_table.shape if shape is None else tuple(shape)
+        size = int(numpy.prod(shape)) * self.dtype.itemsize
+
+        self.memory = create_shared_memory(size) if self.owner else memory
+        self.values = numpy.asarray(SharedBuffer(self.memory, shape=shape, dtype=self.dtype))
+
+    @property
+    def handle(self) -> SharedArrayHandle:
+        """Returns the picklable handle to send to the worker processes."""
+        return SharedArrayHandle(
+            name=self.memory.name,
+            shape=self.values.shape,
+            dtype=self.dtype.str,
+            x_table=self.x_table,
+            y=self.y
+        )
+
+    def __setitem__(self, index, values) -> None:
+        """Writes values at the given index of the shared y values."""
+        self.values[index] = values
+
+    def __getitem__(self, index) -> numpy.ndarray:
+        """Returns the shared y values at the given index."""
+        return self.values[index]
+
+    def close(self) -> None:
+        """
+        Unlinks the block if this SharedArray owns it, and releases its own view of the block.
+
+        The block stays mapped in this process until the views of `values` taken by the caller, such as the
+        y values of `Array.from_shared(copy=False)`, are garbage collected as well.
+        """
+        if getattr(self, 'values', None) is None:
+            return
+
+        self.values = None
+
+        if self.owner:
+            self.memory.unlink()
+
+    def __enter__(self) -> 'SharedArray':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        self.close()
+
+# -
@@ -0,0 +1,459 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Iterator
+
+import numpy
+
+# Approximate size in bytes of the chunks read at once by the out-of-core reductions
+chunk_bytes = 64 * 2**20
+
+# Default number of threads of the reductions, 1 keeps them serial
+default_workers = 1
+
+# Size in bytes below which in-memory reductions stay serial whatever the number of workers
+parallel_bytes = 16 * 2**20
+
+
+def mean_and_std(
+        values: numpy.ndarray,
+        axis: int | tuple[int, ...],
+        keepdims: bool = False) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """
+    Computes the mean and the standard deviation of the values along the given axis, chunk by chunk.
+
+    The values are split along the first reduced axis into chunks of about `chunk_bytes` bytes, the moments
+    of each chunk are computed in memory and merged with RunningMoments. The temporaries are thus the size of
+    a chunk rather than of the values, and memory-mapped values are read once.
+
+    Args:
+        values (numpy.ndarray): The values to reduce.
+        axis (int | tuple[int, ...]): The axis, or axes, along which to reduce.
+        keepdims (bool, optional): If True, the reduced axes are kept with size one. Default is False.
+
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray]: The mean and the standard deviation.
+    """
+    positions = tuple(idx % values.ndim for idx in numpy.atleast_1d(axis))
+
+    moments = RunningMoments()
+    for slicer in iterate_chunks(values, chunk_axis=positions[0]):
+        moments.merge(RunningMoments.from_values(numpy.asarray(values[slicer]), axis=positions))
+
+    mean, std = moments.mean, moments.std
+
+    if keepdims:
+        mean, std = numpy.expand_dims(mean, positions), numpy.expand_dims(std, positions)
+
+    return mean, std
+
+
+def mean(values: numpy.ndarray, axis: int | tuple[int, ...]) -> numpy.ndarray:
+    """
+    Computes the mean of the values along the given axis.
+
+    Args:
+        values (numpy.ndarray): The values to reduce.
+        axis (int | tuple[int, ...]): The axis, or axes, along which to reduce.
+
+    Returns:
+        numpy.ndarray: The mean.
+    """
+    return numpy.mean(values, axis=axis)
+
+
+def std(values: numpy.ndarray, axis: int | tuple[int, ...]) -> numpy.ndarray:
+    """
+    Computes the standard deviation of the values along the given axis.
+
+    Args:
+        values (numpy.ndarray): The values to reduce.
+        axis (int | tuple[int, ...]): The axis, or axes, along which to reduce.
+
+    Returns:
+        numpy.ndarray: The standard deviation.
+    """
+    _, std = mean_and_std(values, axis=axis)
+
+    return std
+
+
+def rsd(values: numpy.ndarray, axis: int | tuple[int, ...]) -> numpy.ndarray:
+    """
+    Computes the relative standard deviation, the standard deviation divided by the mean, of the values
+    along the given axis.
+
+    Args:
+        values (numpy.ndarray): The values to reduce.
+        axis (int | tuple[int, ...]): The axis, or axes, along which to reduce.
+
+    Returns:
+        numpy.ndarray: The relative standard deviation.
+    """
+    mean, std = mean_and_std(values, axis=axis)
+
+    return std / mean
+
+
+def quantile(
+        values: numpy.ndarray,
+        axis: int | tuple[int, ...],
+        q: float | tuple[float, ...],
+        keepdims: bool = False) -> numpy.ndarray:
+    """
+    Computes several quantiles of the values along the given axis with a single partial sort.
+
+    The reduced axes of every curve are flattened together, then one `numpy.partition` call places all the
+    order statistics needed by the quantiles at once, for all the curves, and the quantiles are linearly
+    interpolated between them, as the default method of `numpy.quantile`. Curves with a NaN value give NaN.
+
+    Args:
+        values (numpy.ndarray): The values to reduce.
+        axis (int | tuple[int, ...]): The axis, or axes, along which to reduce.
+        q (float | tuple[float, ...]): The quantile, or quantiles, between 0 and 1.
+        keepdims (bool, optional): If True, the reduced axes are kept with size one. Default is False.
+
+    Returns:
+        numpy.ndarray: The quantiles, with a leading dimension of one entry per quantile if q is a sequence.
+    """
+    positions = tuple(idx % values.ndim for idx in numpy.atleast_1d(axis))
+    free_axes = [idx for idx in range(values.ndim) if idx not in positions]
+
+    # Move the reduced axes last and flatten them, one row per curve
+    samples = numpy.transpose(values, free_axes + list(positions))
+    samples = samples.reshape(samples.shape[:len(free_axes)] + (-1,))
+    n_samples = samples.shape[-1]
+
+    rank = numpy.atleast_1d(q) * (n_samples - 1)
+    lower, upper = numpy.floor(rank).astype(int), numpy.ceil(rank).astype(int)
+
+    partitioned = numpy.partition(samples, numpy.union1d(lower, upper), axis=-1)
+
+    weight = rank - lower
+    result = partitioned[..., lower] * (1 - weight) + partitioned[..., upper] * weight
+    result[numpy.isnan(samples).any(axis=-1)] = numpy.nan
+
+    result = numpy.moveaxis(result, -1, 0)
+
+    if keepdims:
+        result = numpy.expand_dims(result, tuple(1 + idx for idx in positions))
+
+    return result if numpy.ndim(q) else result[0]
+
+
+reductions = {'mean': mean, 'std': std, 'rsd': rsd, 'mean_and_std': mean_and_std}
+
+
+@dataclass
+class RunningMoments:
+    """
+    Running count, mean and sum of squared deviations, merged batch by batch with the
+    pairwise update of Chan et al. so the data never has to be held in memory at once.
+
+    Attributes:
+    -----------
+    count : int
+        The number of samples accumulated so far.
+    mean : numpy.ndarray
+        The running mean of the samples.
+    m2 : numpy.ndarray
+        The running sum of squared deviations from the mean.
+    """
+
+    count: int = 0
+    mean: numpy.ndarray = 0.0
+    m2: numpy.ndarray = 0.0
+
+    def update(self, values: numpy.ndarray, axis: int | tuple[int, ...] | None = None) -> None:
+        """
+        Merges a batch of samples into the running moments.
+
+        Args:
+            values (numpy.ndarray): The batch of samples.
+            axis (int | tuple[int, ...], optional): The sample axis, or axes, of the batch. Default is None,
+                in which case the batch is a single sample.
+        """
+        self.merge(RunningMoments.from_values(values, axis=axis))
+
+    @classmethod
+    def from_values(cls, values: numpy.ndarray, axis: int | tuple[int, ...] | None = None) -> 'RunningMoments':
+        """
+        Returns the moments of a batch of samples.
+
+        Args:
+            values (numpy.ndarray): The batch of samples.
+            axis (int | tuple[int, ...], optional): The sample axis, or axes, of the batch. Default is None,
+                in which case the batch is a single sample.
+
+        Returns:
+            RunningMoments: The moments of the batch.
+        """
+        if axis is None:
+            return cls(count=1, mean=numpy.asarray(values, dtype=float), m2=0.0)
+
+        count = int(numpy.prod([numpy.shape(values)[idx] for idx in numpy.atleast_1d(axis)]))
+        mean = numpy.mean(values, axis=axis, keepdims=True)
+
+        deviation = numpy.subtract(values, mean)
+        numpy.square(deviation, out=deviation)
+
+        return cls(count=count, mean=numpy.squeeze(mean, axis=axis), m2=numpy.sum(deviation, axis=axis))
+
+    def merge(self, other: 'RunningMoments') -> None:
+        """
+        Merges the moments of another set of samples into the running moments.
+
+        Args:
+            other (RunningMoments): The moments to merge.
+        """
+        total = self.count + other.count
+        delta = other.mean - self.mean
+
+        self.mean = self.mean + delta * (other.count / total)
+        self.m2 = self.m2 + other.m2 + delta ** 2 * (self.count * other.count / total)
+        self.count = total
+
+    @property
+    def variance(self) -> numpy.ndarray:
+        """Returns the variance of the samples accumulated so far."""
+        return self.m2 / self.count
+
+    @property
+    def std(self) -> numpy.ndarray:
+        """Returns the standard deviation of the samples accumulated so far."""
+        return numpy.sqrt(self.variance)
+
+    def get_reduction(self, name: str) -> numpy.ndarray | tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Returns the named reduction, one of the keys of `reductions`, of the samples accumulated so far.
+
+        Args:
+            name (str): The name of the reduction.
+
+        Returns:
+            numpy.ndarray | tuple[numpy.ndarray, numpy.ndarray]: The reduced values.
+        """
+        return {
+            'mean': lambda: self.mean,
+            'std': lambda: self.std,
+            'rsd': lambda: self.std / self.mean,
+            'mean_and_std': lambda: (self.mean, self.std),
+        }[name]()
+
+
+@dataclass
+class Summary:
+    """
+    Summary statistics of an array, ignoring its NaN values.
+
+    Attributes:
+    -----------
+    minimum : float
+        The minimum value.
+    maximum : float
+        The maximum value.
+    abs_maximum : float
+        The maximum absolute value.
+    nan_count : int
+        The number of NaN values.
+    mean : float
+        The mean value.
+    std : float
+        The standard deviation of the values.
+    """
+
+    minimum: float
+    maximum: float
+    abs_maximum: float
+    nan_count: int
+    mean: float
+    std: float
+
+
+def summarize(values: numpy.ndarray) -> Summary:
+    """
+    Computes the summary statistics of the values in a single pass over chunks of about `chunk_bytes` bytes.
+
+    Args:
+        values (numpy.ndarray): The values to summarize.
+
+    Returns:
+        Summary: The summary statistics, NaN where no value is available.
+    """
+    minimum, maximum, abs_maximum = numpy.inf, -numpy.inf, 0
+    nan_count = 0
+    moments = RunningMoments()
+
+    for slicer in iterate_chunks(values, chunk_axis=0):
+        chunk = numpy.ravel(values[slicer])
+
+        is_nan = numpy.isnan(chunk)
+        nan_count += int(numpy.count_nonzero(is_nan))
+        chunk = chunk[~is_nan]
+
+        if chunk.size == 0:
+            continue
+
+        chunk_minimum, chunk_maximum = chunk.min(), chunk.max()
+        minimum, maximum = min(minimum, chunk_minimum), max(maximum, chunk_maximum)
+        abs_maximum = max(abs_maximum, abs(chunk_minimum), abs(chunk_maximum))
+
+        moments.update(chunk, axis=0)
+
+    if moments.count == 0:
+        return Summary(numpy.nan, numpy.nan, numpy.nan, nan_count, numpy.nan, numpy.nan)
+
+    return Summary(
+        minimum=float(minimum),
+        maximum=float(maximum),
+        abs_maximum=float(abs_maximum),
+        nan_count=nan_count,
+        mean=float(moments.mean),
+        std=float(moments.std)
+    )
+
+
+def iterate_chunks(values: numpy.ndarray, chunk_axis: int, n_chunks: int | None = None) -> Iterator[tuple]:
+    """
+    Yields slicers splitting the values along the chunk axis into chunks of about `chunk_bytes` bytes.
+
+    Args:
+        values (numpy.ndarray): The values to split.
+        chunk_axis (int): The axis along which to split.
+        n_chunks (int, optional): The number of chunks to split into instead, at most the size of the axis.
+
+    Yields:
+        tuple: The slicer selecting each chunk.
+    """
+    size = values.shape[chunk_axis]
+
+    if n_chunks is None:
+        step = max(1, int(chunk_bytes * size // max(1, values.nbytes)))
+    else:
+        step = max(1, -(-size // n_chunks))
+
+    for start in range(0, size, step):
+        slicer = [slice(None)] * values.ndim
+        slicer[chunk_axis] = slice(start, start + step)
+
+        yield tuple(slicer)
+
+
+def chunked_reduce(
+        name: str,
+        values: numpy.ndarray,
+        axis: int | tuple[int, ...],
+        workers: int = 1,
+        n_chunks: int | None = None) -> numpy.ndarray | tuple:
+    """
+    Computes the named reduction chunk by chunk, so only one chunk of the values per worker is in memory at once.
+
+    The values are split along the largest non-reduced axis and each chunk of the output is written
+    in place into the preallocated output. If every axis is reduced, the values are split along a reduced
+    axis instead and the chunks are merged with RunningMoments. With several workers, the chunks are reduced
+    in a thread pool, numpy releasing the GIL during the reductions.
+
+    Args:
+        name (str): The name of the reduction, a key of `reductions`.
+        values (numpy.ndarray): The values to reduce, typically a numpy.memmap.
+        axis (int | tuple[int, ...]): The axis, or axes, along which to reduce.
+        workers (int, optional): The number of threads reducing the chunks. Default is 1.
+        n_chunks (int, optional): The number of chunks to split into. Default is chunks of about `chunk_bytes` bytes.
+
+    Returns:
+        numpy.ndarray | tuple: The reduced values.
+    """
+    positions = tuple(idx % values.ndim for idx in numpy.atleast_1d(axis))
+    free_axes = [idx for idx in range(values.ndim) if idx not in positions]
+
+    if not free_axes:
+        slicers = iterate_chunks(values, chunk_axis=positions[0], n_chunks=n_chunks)
+
+        def get_moments(slicer: tuple) -> RunningMoments:
+            return RunningMoments.from_values(numpy.asarray(values[slicer]), axis=positions)
+
+        moments = RunningMoments()
+        for chunk_moments in map_chunks(get_moments, slicers, workers=workers):
+            moments.merge(chunk_moments)
+
+        return moments.get_reduction(name)
+
+    chunk_axis = max(free_axes, key=lambda idx: values.shape[idx])
+    output_shape = tuple(values.shape[idx] for idx in free_axes)
+
+    def reduce_chunk(slicer: tuple) -> tuple:
+        results = reductions[name](numpy.asarray(values[slicer]), axis=positions)
+
+        return results if isinstance(results, tuple) else (results,)
+
+    def write_chunk(slicer: tuple) -> None:
+        output_slicer = tuple(slicer[idx] for idx in free_axes)
+
+        for output, result in zip(outputs, reduce_chunk(slicer)):
+            output[output_slicer] = result
+
+    # Reducing an empty chunk gives the dtypes of the outputs, which are then filled chunk by chunk
+    empty_slicer = tuple(slice(0, 0) if idx == chunk_axis else slice(None) for idx in range(values.ndim))
+    outputs = tuple(numpy.empty(output_shape, dtype=result.dtype) for result in reduce_chunk(empty_slicer))
+
+    slicers = iterate_chunks(values, chunk_axis=chunk_axis, n_chunks=n_chunks)
+
+    for _ in map_chunks(write_chunk, slicers, workers=workers):
+        pass
+
+    return outputs if len(outputs) > 1 else outputs[0]
+
+
+def map_chunks(function: Callable, slicers: Iterator[tuple], workers: int = 1) -> Iterator:
+    """
+    Applies the function to every chunk slicer, in a thread pool if there are several workers.
+
+    Args:
+        function (Callable): The function to apply to each slicer.
+        slicers (Iterator[tuple]): The chunk slicers.
+        workers (int, optional): The number of threads. Default is 1, applying the function in the calling thread.
+
+    Yields:
+        Any: The result of each call, in the order of the slicers.
+    """
+    if workers <= 1:
+        yield from map(function, slicers)
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(function, slicers)
+
+
+def reduce(
+        name: str,
+        values: numpy.ndarray,
+        axis: int | tuple[int, ...],
+        workers: int | None = None) -> numpy.ndarray | tuple:
+    """
+    Computes the named reduction of the values, chunk by chunk if they are memory-mapped.
+
+    With several workers, memory-mapped values are reduced a chunk per thread, and in-memory values of
+    at least `parallel_bytes` bytes are split in a few chunks per worker reduced in a thread pool.
+
+    Args:
+        name (str): The name of the reduction, a key of `reductions`.
+        values (numpy.ndarray): The values to reduce.
+        axis (int | tuple[int, ...]): The axis, or axes, along which to reduce.
+        workers (int, optional): The number of threads. Default is `default_workers`.
+
+    Returns:
+        numpy.ndarray | tuple: The reduced values.
+    """
+    workers = workers or default_workers
+
+    if isinstance(values, numpy.memmap):
+        return chunked_reduce(name, values, axis=axis, workers=workers)
+
+    if workers > 1 and values.nbytes >= parallel_bytes:
+        return chunked_reduce(name, values, axis=axis, workers=workers, n_chunks=4 * workers)
+
+    return reductions[name](values, axis=axis)
+
+# -
@@ -0,0 +1,430 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import importlib
+import json
+import lzma
+import sys
+import zlib
+from pathlib import Path
+from typing import Any
+
+import numpy
+
+from DataVisual.tables import Table
+from DataVisual.units import BaseUnit
+
+# Version of the on-disk layout written by `save`
+format_version = 1
+
+header_filename = 'header.json'
+
+# Approximate size in bytes of the uncompressed chunks written by `save_chunked`
+chunk_bytes = 2**20
+
+compressors = {
+    'zlib': (zlib.compress, zlib.decompress),
+    'lzma': (lzma.compress, lzma.decompress),
+    None: (bytes, bytes),
+}
+
+
+def get_unit_header(unit: BaseUnit) -> dict:
+    """
+    Returns the JSON-serializable metadata needed to rebuild the unit, without its values.
+
+    Args:
+        unit (BaseUnit): The unit to describe.
+
+    Returns:
+        dict: The unit class, labels, string format and scaling settings.
+    """
+    return dict(
+        module=type(unit).__module__,
+        cls=type(unit).__qualname__,
+        long_label=unit.long_label,
+        short_label=unit.short_label,
+        string_format=unit.string_format,
+        use_prefix=unit.use_prefix,
+        use_long_label_for_repr=unit.use_long_label_for_repr,
+        normalized=unit.normalized,
+        auto_scale=unit.auto_scale,
+        value_representation=None,
+    )
+
+
+def save_unit(unit: BaseUnit, path: Path, name: str) -> dict:
+    """
+    Writes the value representation of the unit, if any, as `<name>_representation.npy` and returns its metadata.
+
+    Args:
+        unit (BaseUnit): The unit to save.
+        path (Path): The directory to write.
+        name (str): The name of the unit in the directory, such as 'y' or 'axis_0'.
+
+    Returns:
+        dict: The unit metadata, see `get_unit_header`, referencing the file of its value representation.
+    """
+    header = get_unit_header(unit)
+
+    if unit.value_representation is not None:
+        representation = numpy.asarray(unit.value_representation)
+
+        # Object arrays, such as lists of labels, are stored as strings so they load without pickle
+        if representation.dtype == object:
+            representation = representation.astype(str)
+
+        header['value_representation'] = f'{name}_representation.npy'
+        numpy.save(path / header['value_representation'], representation)
+
+    return header
+
+
+def get_unit_class(header: dict) -> type:
+    """
+    Returns the unit class named by the metadata, which must be a BaseUnit subclass.
+
+    Modules of DataVisual are imported as needed, other modules, such as the one defining a custom unit,
+    must have been imported beforehand, so a header never imports arbitrary code.
+
+    Args:
+        header (dict): The unit metadata.
+
+    Returns:
+        type: The unit class.
+
+    Raises:
+        TypeError: If the module is not imported, or the class is not a BaseUnit subclass.
+    """
+    module_name = header['module']
+
+    if module_name in sys.modules:
+        module = sys.modules[module_name]
+    elif module_name.split('.')[0] == 'DataVisual':
+        module = importlib.import_module(module_name)
+    else:
+        raise TypeError(f"The module {module_name!r} of the unit {header['cls']!r} must be imported before loading it.")
+
+    unit_class = getattr(module, header['cls'], None)
+
+    if not (isinstance(unit_class, type) and issubclass(unit_class, BaseUnit)):
+        raise TypeError(f"{module_name}.{header['cls']} is not a BaseUnit subclass.")
+
+    return unit_class
+
+
+def build_unit(header: dict, base_values: numpy.ndarray, path: Path | None = None) -> BaseUnit:
+    """
+    Rebuilds a unit from the metadata written by `save_unit` and its base values.
+
+    Args:
+        header (dict): The unit metadata.
+        base_values (numpy.ndarray): The base values of the unit.
+        path (Path, optional): The directory holding the file of the value representation, if any. Default is None.
+
+    Returns:
+        BaseUnit: The rebuilt unit instance.
+
+    Raises:
+        TypeError: If the unit class is not a BaseUnit subclass, see `get_unit_class`.
+    """
+    unit_class = get_unit_class(header)
+
+    representation_file = header.get('value_representation')
+    value_representation = numpy.load(path / representation_file) if representation_file and path else None
+
+    return unit_class(
+        long_label=header['long_label'],
+        short_label=header['short_label'],
+        string_format=header['string_format'],
+        use_prefix=header['use_prefix'],
+        use_long_label_for_repr=header['use_long_label_for_repr'],
+        normalized=header['normalized'],
+        auto_scale=header.get('auto_scale', True),
+        value_representation=value_representation,
+        base_values=base_values,
+    )
+
+
+def save(array, path: str | Path) -> Path:
+    """
+    Saves an Array to a directory as raw .npy buffers plus a small JSON header.
+
+    The directory contains `header.json`, describing the y unit and the x_table units in axis order,
+    `y.npy` with the y base values and one `axis_<i>.npy` file per x_table parameter, plus a
+    `<name>_representation.npy` file per unit with a value representation.
+
+    Args:
+        array (Array): The Array to save.
+        path (str | Path): The directory to write, created if needed.
+
+    Returns:
+        Path: The directory written.
+    """
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+
+    header = dict(
+        format_version=format_version,
+        y=save_unit(array.y, path, 'y'),
+        x_table=[save_unit(x, path, f'axis_{idx}') for idx, x in enumerate(array.x_table)],
+    )
+
+    numpy.save(path / 'y.npy', array.y.base_values)
+
+    for idx, x in enumerate(array.x_table):
+        numpy.save(path / f'axis_{idx}.npy', x.base_values)
+
+    (path / header_filename).write_text(json.dumps(header, indent=4))
+
+    return path
+
+
+def load(path: str | Path, mmap: bool = True) -> tuple[Table, BaseUnit]:
+    """
+    Loads the x_table and y unit of an Array saved with `save`.
+
+    Args:
+        path (str | Path): The directory to read.
+        mmap (bool, optional): If True, the y values are memory-mapped read-only instead of read. Default is True.
+
+    Returns:
+        tuple[Table, BaseUnit]: The x_table and the y unit.
+    """
+    path = Path(path)
+
+    header = json.loads((path / header_filename).read_text())
+
+    if header['format_version'] > format_version:
+        raise ValueError(f"Unsupported format version {header['format_version']}, expected at most {format_version}.")
+
+    x_table = Table([
+        build_unit(x_header, numpy.load(path / f'axis_{idx}.npy'), path=path)
+        for idx, x_header in enumerate(header['x_table'])
+    ])
+
+    if 'chunks' in header:
+        y_values = ChunkedStore(path).read_values()
+    else:
+        y_values = numpy.load(path / 'y.npy', mmap_mode='r' if mmap else None)
+
+    return x_table, build_unit(header['y'], y_values, path=path)
+
+
+def get_default_chunk_shape(shape: tuple[int, ...], itemsize: int) -> tuple[int, ...]:
+    """
+    Returns a chunk shape of about `chunk_bytes` bytes, obtained by halving the largest dimension until small enough.
+
+    Args:
+        shape (tuple[int, ...]): The shape of the values to chunk.
+        itemsize (int): The size in bytes of one value.
+
+    Returns:
+        tuple[int, ...]: The chunk shape.
+    """
+    chunk_shape = list(shape)
+
+    while numpy.prod(chunk_shape) * itemsize > chunk_bytes and max(chunk_shape) > 1:
+        idx = int(numpy.argmax(chunk_shape))
+        chunk_shape[idx] = -(-chunk_shape[idx] // 2)
+
+    return tuple(chunk_shape)
+
+
+def save_chunked(
+        array,
+        path: str | Path,
+        chunk_shape: tuple[int, ...] | None = None,
+        compression: str | None = 'zlib') -> Path:
+    """
+    Saves an Array to a directory with its y values split in independently compressed chunks.
+
+    The layout is the one of `save`, except that `y.npy` is replaced by `chunks.bin`, the concatenated
+    compressed chunks, and `index.npy`, the (offset, length) of each chunk in `chunks.bin` on the chunk grid.
+
+    Args:
+        array (Array): The Array to save.
+        path (str | Path): The directory to write, created if needed.
+        chunk_shape (tuple[int, ...], optional): The shape of the chunks. Default is about `chunk_bytes` per chunk.
+        compression (str, optional): The compression of the chunks, 'zlib', 'lzma' or None. Default is 'zlib'.
+
+    Returns:
+        Path: The directory written.
+    """
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+
+    values = array.y.base_values
+    chunk_shape = chunk_shape or get_default_chunk_shape(values.shape, values.dtype.itemsize)
+    grid_shape = tuple(-(-size // chunk) for size, chunk in zip(values.shape, chunk_shape))
+
+    compress, _ = compressors[compression]
+    index = numpy.empty(grid_shape + (2,), dtype=numpy.int64)
+
+    with open(path / 'chunks.bin', 'wb') as file:
+        for grid_index in numpy.ndindex(grid_shape):
+            slicer = tuple(slice(idx * chunk, (idx + 1) * chunk) for idx, chunk in zip(grid_index, chunk_shape))
+
+            data = compress(numpy.ascontiguousarray(values[slicer]).tobytes())
+
+            index[grid_index] = file.tell(), len(data)
+            file.write(data)
+
+    numpy.save(path / 'index.npy', index)
+
+    for idx, x in enumerate(array.x_table):
+        numpy.save(path / f'axis_{idx}.npy', x.base_values)
+
+    header = dict(
+        format_version=format_version,
+        y=save_unit(array.y, path, 'y'),
+        x_table=[save_unit(x, path, f'axis_{idx}') for idx, x in enumerate(array.x_table)],
+        chunks=dict(
+            shape=values.shape,
+            dtype=values.dtype.str,
+            chunk_shape=chunk_shape,
+            compression=compression,
+        ),
+    )
+
+    (path / header_filename).write_text(json.dumps(header, indent=4))
+
+    return path
+
+
+class ChunkedStore:
+    """
+    Read access to an Array saved with `save_chunked`, decompressing only the chunks a selection touches.
+
+    Attributes:
+    -----------
+    path : Path
+        The directory of the store.
+    x_table : Table
+        The table of the X dimensions, over the whole stored values.
+    array_class : type
+        The class of the Arrays returned by `isel`.
+    """
+
+    def __init__(self, path: str | Path, array_class: type = None):
+        """
+        Args:
+            path (str | Path): The directory of the store.
+            array_class (type, optional): The class of the Arrays returned by `isel`. Default is Array.
+        """
+        if array_class is None:
+            # Imported here as multi_array imports this module
+            from DataVisual.multi_array import Array as array_class
+
+        self.path = Path(path)
+        self.array_class = array_class
+
+        self.header = json.loads((self.path / header_filename).read_text())
+        chunks = self.header['chunks']
+
+        self.shape = tuple(chunks['shape'])
+        self.dtype = numpy.dtype(chunks['dtype'])
+        self.chunk_shape = tuple(chunks['chunk_shape'])
+        _, self.decompress = compressors[chunks['compression']]
+
+        self.index = numpy.load(self.path / 'index.npy')
+
+        self.x_table = Table([
+            build_unit(x_header, numpy.load(self.path / f'axis_{idx}.npy'), path=self.path)
+            for idx, x_header in enumerate(self.header['x_table'])
+        ])
+
+    def read_chunk(self, file, grid_index: tuple[int, ...]) -> numpy.ndarray:
+        """
+        Reads and decompresses one chunk.
+
+        Args:
+            file (BinaryIO): The opened `chunks.bin` file.
+            grid_index (tuple[int, ...]): The index of the chunk on the chunk grid.
+
+        Returns:
+            numpy.ndarray: The values of the chunk.
+        """
+        offset, length = self.index[grid_index]
+        file.seek(offset)
+
+        shape = tuple(
+            min(chunk, size - idx * chunk) for idx, chunk, size in zip(grid_index, self.chunk_shape, self.shape)
+        )
+
+        return numpy.frombuffer(self.decompress(file.read(length)), dtype=self.dtype).reshape(shape)
+
+    def read_values(self, ranges: list[range] | None = None) -> numpy.ndarray:
+        """
+        Reads the values over the given index ranges, decompressing only the chunks they overlap.
+
+        Args:
+            ranges (list[range], optional): For each axis, the contiguous range of indices to read. Default is everything.
+
+        Returns:
+            numpy.ndarray: The values read.
+        """
+        ranges = ranges or [range(size) for size in self.shape]
+        output = numpy.empty(tuple(len(r) for r in ranges), dtype=self.dtype)
+
+        grid_ranges = [
+            range(r.start // chunk, (r.stop - 1) // chunk + 1) if len(r) else range(0)
+            for r, chunk in zip(ranges, self.chunk_shape)
+        ]
+
+        with open(self.path / 'chunks.bin', 'rb') as file:
+            for grid_index in numpy.ndindex(tuple(len(g) for g in grid_ranges)):
+                grid_index = tuple(g[idx] for g, idx in zip(grid_ranges, grid_index))
+
+                chunk = self.read_chunk(file, grid_index)
+
+                chunk_slicer, output_slicer = [], []
+                for idx, chunk_size, r in zip(grid_index, self.chunk_shape, ranges):
+                    start = max(r.start, idx * chunk_size)
+                    stop = min(r.stop, (idx + 1) * chunk_size)
+
+                    chunk_slicer.append(slice(start - idx * chunk_size, stop - idx * chunk_size))
+                    output_slicer.append(slice(start - r.start, stop - r.start))
+
+                output[tuple(output_slicer)] = chunk[tuple(chunk_slicer)]
+
+        return output
+
+    def isel(self, indexers: dict[BaseUnit | str, int | slice]) -> Any:
+        """
+        Returns the Array selected by integer index or slice along some axes, reading only the chunks it needs.
+
+        Axes selected by an integer are dropped from the x_table, axes selected by a slice are sliced.
+
+        Args:
+            indexers (dict[BaseUnit | str, int | slice]): The selection, keyed by x_table unit or unit label.
+
+        Returns:
+            Array: The selected Array instance.
+
+        Raises:
+            TypeError: If an indexer is neither an integer nor a slice, such as a list or an array.
+        """
+        selection = self.x_table.get_selection(indexers)
+
+        ranges, post_slicer = [], []
+        for indexer, size in zip(selection, self.shape):
+            if isinstance(indexer, slice):
+                indices = range(size)[indexer]
+                start, stop = (min(indices), max(indices) + 1) if len(indices) else (0, 0)
+                ranges.append(range(start, stop))
+                post_slicer.append(slice(indices.start - start, None, indices.step) if len(indices) else slice(0, 0))
+            else:
+                index = range(size)[indexer]
+                ranges.append(range(index, index + 1))
+                post_slicer.append(0)
+
+        values = self.read_values(ranges)[tuple(post_slicer)]
+
+        x_table = self.x_table.select(selection)
+
+        y = build_unit(self.header['y'], values, path=self.path)
+
+        return self.array_class(x_table=x_table, y=y)
+
+# -
@@ -0,0 +1,663 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import functools
+import hashlib
+import itertools
+import os
+import pickle
+import sys
+import time
+import types
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable
+
+import numpy
+
+from DataVisual.shared import SharedArray, SharedArrayHandle
+from DataVisual.tables import Table
+
+
+def get_grid(x_table: Table) -> list[numpy.ndarray]:
+    """
+    Returns the open grid of the base values of the x_table parameters, broadcasting to the shape of the table.
+
+    Args:
+        x_table (Table): The table of the X dimensions.
+
+    Returns:
+        list[numpy.ndarray]: The base values of each parameter, shaped to broadcast along its own dimension.
+    """
+    return numpy.meshgrid(*(x.base_values for x in x_table), indexing='ij', sparse=True)
+
+
+def get_points(axes_values: tuple[numpy.ndarray, ...], indices: numpy.ndarray) -> list[numpy.ndarray]:
+    """
+    Returns the coordinates of some points of the grid.
+
+    Args:
+        axes_values (tuple[numpy.ndarray, ...]): The base values of the x_table parameters.
+        indices (numpy.ndarray): The flat indices of the points in the grid.
+
+    Returns:
+        list[numpy.ndarray]: The values of each parameter at the points.
+    """
+    shape = tuple(len(values) for values in axes_values)
+
+    return [values[index] for values, index in zip(axes_values, numpy.unravel_index(indices, shape))]
+
+
+def evaluate_vectorized(
+        func: Callable,
+        x_table: Table,
+        out: numpy.ndarray,
+        indices: numpy.ndarray | None = None) -> None:
+    """
+    Evaluates the function in a single call, with one broadcast array per parameter.
+
+    Args:
+        func (Callable): The function, taking the values of the parameters in the order of the x_table.
+        x_table (Table): The table of the X dimensions.
+        out (numpy.ndarray): The buffer, of the shape of the table, to write the results into.
+        indices (numpy.ndarray, optional): The flat indices of the points to evaluate. Default is the whole grid.
+    """
+    if indices is None:
+        out[...] = func(*get_grid(x_table))
+        return
+
+    points = get_points(tuple(x.base_values for x in x_table), indices)
+
+    out.reshape(-1)[indices] = numpy.broadcast_to(func(*points), indices.shape)
+
+
+def evaluate_points(func: Callable, axes_values: tuple[numpy.ndarray, ...], indices: numpy.ndarray) -> numpy.ndarray:
+    """
+    Evaluates the function point by point over some points of the grid.
+
+    Args:
+        func (Callable): The function, taking the scalar values of the parameters in the order of the x_table.
+        axes_values (tuple[numpy.ndarray, ...]): The base values of the x_table parameters.
+        indices (numpy.ndarray): The flat indices of the points in the grid.
+
+    Returns:
+        numpy.ndarray: The results, one per point.
+    """
+    points = zip(*get_points(axes_values, indices))
+
+    return numpy.array([func(*point) for point in points])
+
+
+def evaluate_points_shared(
+        func: Callable,
+        handle: SharedArrayHandle,
+        axes_values: tuple[numpy.ndarray, ...],
+        indices: numpy.ndarray,
+        offset: int) -> None:
+    """
+    Evaluates the function point by point over some points of the grid, writing the results in shared memory.
+
+    Args:
+        func (Callable): The function, taking the scalar values of the parameters in the order of the x_table.
+        handle (SharedArrayHandle): The handle of the flat SharedArray of the evaluated points to write the results into.
+        axes_values (tuple[numpy.ndarray, ...]): The base values of the x_table parameters.
+        indices (numpy.ndarray): The flat indices of the points in the grid.
+        offset (int): The position of the first of the points in the SharedArray.
+    """
+    with handle.attach() as shared:
+        shared.values[offset:offset + len(indices)] = evaluate_points(func, axes_values, indices)
+
+
+def evaluate_chunked(
+        func: Callable,
+        x_table: Table,
+        out: numpy.ndarray,
+        indices: numpy.ndarray | None = None,
+        executor: Executor | None = None,
+        chunk_size: int | None = None) -> None:
+    """
+    Evaluates the function point by point, in chunks of points mapped over an executor.
+
+    Each chunk is written into the output buffer as soon as its result arrives. With a process pool, the
+    workers write their results into a shared memory buffer, of one entry per evaluated point, instead of
+    sending them back through pipes.
+
+    Args:
+        func (Callable): The function, taking the scalar values of the parameters in the order of the x_table.
+            With a process pool it must be picklable, e.g. defined at the top level of a module.
+        x_table (Table): The table of the X dimensions.
+        out (numpy.ndarray): The buffer, of the shape of the table, to write the results into.
+        indices (numpy.ndarray, optional): The flat indices of the points to evaluate. Default is the whole grid.
+        executor (Executor, optional): The executor evaluating the chunks. Default is a new process pool.
+        chunk_size (int, optional): The number of points per chunk. Default is about four chunks per processor.
+    """
+    axes_values = tuple(numpy.asarray(x.base_values) for x in x_table)
+    indices = numpy.arange(out.size) if indices is None else indices
+
+    chunk_size = chunk_size or max(1, -(-len(indices) // (4 * (os.cpu_count() or 1))))
+    starts = range(0, len(indices), chunk_size)
+
+    flat_out = out.reshape(-1)
+
+    own_executor = executor is None
+    executor = ProcessPoolExecutor() if own_executor else executor
+
+    try:
+        if isinstance(executor, ProcessPoolExecutor):
+            with SharedArray(x_table, dtype=out.dtype, shape=(len(indices),)) as shared:
+                futures = [
+                    executor.submit(
+                        evaluate_points_shared, func, shared.handle, axes_values, indices[start:start + chunk_size], start
+                    ) for start in starts
+                ]
+
+                for future in as_completed(futures):
+                    future.result()
+
+                flat_out[indices] = shared.values
+        else:
+            futures = {
+                executor.submit(evaluate_points, func, axes_values, indices[start:start + chunk_size]): start
+                for start in starts
+            }
+
+            for future in as_completed(futures):
+                start = futures[future]
+                flat_out[indices[start:start + chunk_size]] = future.result()
+    finally:
+        if own_executor:
+            executor.shutdown(cancel_futures=True)
+
+
+def try_vectorized(
+        func: Callable,
+        x_table: Table,
+        out: numpy.ndarray,
+        indices: numpy.ndarray | None = None) -> bool:
+    """
+    Evaluates the function in a single call with broadcast arrays, if it accepts them.
+
+    The real evaluation serves as the detection, so a vectorized function is called once and a scalar-only
+    one only starts a single call: scalar-only code such as `math` functions or `if` statements raises a
+    TypeError or ValueError on arrays, or returns values which do not broadcast to the evaluated points.
+    The output buffer is only written if the function is vectorized.
+
+    Args:
+        func (Callable): The function, taking the values of the parameters in the order of the x_table.
+        x_table (Table): The table of the X dimensions.
+        out (numpy.ndarray): The buffer, of the shape of the table, to write the results into.
+        indices (numpy.ndarray, optional): The flat indices of the points to evaluate. Default is the whole grid.
+
+    Returns:
+        bool: True if the function is vectorized, and the points were evaluated.
+    """
+    if indices is None:
+        points, shape = get_grid(x_table), out.shape
+    else:
+        points, shape = get_points(tuple(x.base_values for x in x_table), indices), indices.shape
+
+    try:
+        result = numpy.asarray(func(*points))
+        accepted = result.dtype != object and numpy.broadcast_shapes(result.shape, shape) == shape
+    except (TypeError, ValueError):
+        return False
+
+    if not accepted:
+        return False
+
+    if indices is None:
+        out[...] = result
+    else:
+        out.reshape(-1)[indices] = numpy.broadcast_to(result, shape)
+
+    return True
+
+
+def evaluate(
+        func: Callable,
+        x_table: Table,
+        out: numpy.ndarray,
+        indices: numpy.ndarray | None = None,
+        vectorized: bool | None = None,
+        executor: Executor | None = None,
+        chunk_size: int | None = None) -> numpy.ndarray:
+    """
+    Evaluates the function over the Cartesian product of the base values of the x_table parameters.
+
+    Args:
+        func (Callable): The function, taking the values of the parameters in the order of the x_table.
+        x_table (Table): The table of the X dimensions.
+        out (numpy.ndarray): The preallocated buffer, of the shape of the table, to write the results into.
+        indices (numpy.ndarray, optional): The flat indices of the points to evaluate. Default is the whole grid.
+        vectorized (bool, optional): Whether the function accepts broadcast arrays, evaluating the whole grid
+            in a single call. Default is to try a single call first, see `try_vectorized`, which is best
+            avoided for scalar-only functions with side effects.
+        executor (Executor, optional): The executor of the point by point evaluation. Default is a new process pool.
+        chunk_size (int, optional): The number of points per chunk of the point by point evaluation.
+
+    Returns:
+        numpy.ndarray: The output buffer.
+    """
+    if vectorized is None and try_vectorized(func, x_table, out=out, indices=indices):
+        return out
+
+    if vectorized:
+        evaluate_vectorized(func, x_table, out=out, indices=indices)
+    else:
+        evaluate_chunked(func, x_table, out=out, indices=indices, executor=executor, chunk_size=chunk_size)
+
+    return out
+
+
+def hash_value(hasher: 'hashlib._Hash', value, seen: set) -> None:
+    """
+    Updates the hasher with the content of a value referenced by a function: its code, data or arguments.
+
+    Args:
+        hasher (hashlib._Hash): The hasher to update.
+        value (Any): The value, such as a function, a code object, a module, an array or a picklable object.
+        seen (set): The ids of the functions already hashed, to stop at recursive references.
+
+    Raises:
+        TypeError: If the value can neither be hashed as a function nor pickled.
+    """
+    if isinstance(value, types.CodeType):
+        # The bytecode only indexes the names and constants, which are hashed along with it
+        signature = (
+            value.co_argcount, value.co_posonlyargcount, value.co_kwonlyargcount, value.co_flags,
+            value.co_names, value.co_varnames[:value.co_argcount + value.co_kwonlyargcount],
+        )
+        hasher.update(value.co_code)
+        hasher.update(pickle.dumps(signature, protocol=4))
+
+        for constant in value.co_consts:
+            hash_value(hasher, constant, seen)
+
+        return
+
+    if isinstance(value, types.ModuleType):
+        hasher.update(f'module {value.__name__} {get_module_version(value)}'.encode())
+        return
+
+    if isinstance(value, type):
+        hasher.update(f'class {value.__module__}.{value.__qualname__}'.encode())
+        return
+
+    if isinstance(value, numpy.ndarray):
+        hasher.update(f'array {value.dtype.str} {value.shape}'.encode())
+        hasher.update(numpy.ascontiguousarray(value).tobytes())
+        return
+
+    if callable(value):
+        hash_function(hasher, value, seen)
+        return
+
+    try:
+        hasher.update(pickle.dumps(value, protocol=4))
+    except Exception as error:
+        raise TypeError(f"Cannot hash {value!r} referenced by the evaluated function, give the cache key explicitly.") from error
+
+
+def get_module_version(module: types.ModuleType) -> str | None:
+    """
+    Returns the version of the distribution of a module, given by the `__version__` of its top-level package.
+
+    Args:
+        module (types.ModuleType): The module.
+
+    Returns:
+        str | None: The version, None if the package does not define one.
+    """
+    package = sys.modules.get(module.__name__.partition('.')[0], module)
+
+    return getattr(package, '__version__', None)
+
+
+def hash_function(hasher: 'hashlib._Hash', func: Callable, seen: set) -> None:
+    """
+    Updates the hasher with the identity and the behaviour of a function.
+
+    The qualified name, the code, the default arguments, the closure cells and the referenced globals of
+    Python functions are hashed, recursively for the functions they reference, as are the function and
+    arguments of `functools.partial` objects and the instance of bound methods. The code is hashed with the
+    names it references, including attribute and method names such as `numpy.sin`, and with its signature.
+    Builtin functions and ufuncs are identified by their name, modules by their name and the version of
+    their package, so the key changes when a referenced package is upgraded but not when its code is edited
+    in place.
+
+    Args:
+        hasher (hashlib._Hash): The hasher to update.
+        func (Callable): The function.
+        seen (set): The ids of the functions already hashed, to stop at recursive references.
+
+    Raises:
+        TypeError: If a value referenced by the function can not be hashed.
+    """
+    if id(func) in seen:
+        hasher.update(b'recursive reference')
+        return
+
+    seen.add(id(func))
+
+    if isinstance(func, functools.partial):
+        hasher.update(b'partial')
+        for value in (func.func, func.args, sorted(func.keywords.items())):
+            hash_value(hasher, value, seen)
+        return
+
+    if isinstance(func, types.MethodType):
+        hasher.update(b'method')
+        hash_function(hasher, func.__func__, seen)
+        hash_value(hasher, func.__self__, seen)
+        return
+
+    if isinstance(func, (types.BuiltinFunctionType, numpy.ufunc)):
+        hasher.update(f'builtin {getattr(func, "__module__", None)}.{func.__name__}'.encode())
+        return
+
+    if not isinstance(func, types.FunctionType):
+        # Callable instance: its class and its state
+        hash_value(hasher, type(func), seen)
+        hash_function(hasher, type(func).__call__, seen)
+        hash_value(hasher, vars(func) if hasattr(func, '__dict__') else repr(func), seen)
+        return
+
+    hasher.update(f'function {func.__module__}.{func.__qualname__}'.encode())
+    hash_value(hasher, func.__code__, seen)
+
+    for value in (func.__defaults__, func.__kwdefaults__):
+        hash_value(hasher, value, seen)
+
+    for cell in func.__closure__ or ():
+        hash_value(hasher, cell.cell_contents, seen)
+
+    for name in get_global_names(func.__code__):
+        if name in func.__globals__:
+            hasher.update(name.encode())
+            hash_value(hasher, func.__globals__[name], seen)
+
+
+def get_global_names(code: types.CodeType) -> list[str]:
+    """
+    Returns the names referenced by a code object and by the code objects nested in it, such as comprehensions.
+
+    Args:
+        code (types.CodeType): The code object.
+
+    Returns:
+        list[str]: The referenced names, without duplicates.
+    """
+    names = dict.fromkeys(code.co_names)
+
+    for constant in code.co_consts:
+        if isinstance(constant, types.CodeType):
+            names.update(dict.fromkeys(get_global_names(constant)))
+
+    return list(names)
+
+
+class SweepCache:
+    """
+    Persistent cache of the results of sweep evaluations, so that only the grid points never evaluated
+    before are computed.
+
+    Each result is content-addressed by a hash of the function and of the values of the parameters at its
+    grid point, so a sweep with an extended or shifted axis reuses the results of the points it shares with
+    previous sweeps. The function is hashed with its code, defaults, closure and referenced globals, see
+    `hash_function`, or identified by an explicit key.
+
+    The results of each data type are stored in a local directory as arrays sorted by key, looked up with a
+    vectorized binary search, and the least recently used ones are evicted beyond `max_entries`. Each store is
+    replaced atomically, concurrent writers may drop each other's new results but never corrupt the cache.
+    The access stamps of the results live in a separate file, updated in place on lookups.
+
+    Attributes:
+    -----------
+    directory : Path
+        The directory of the cache.
+    max_entries : int
+        The maximum number of cached results per data type.
+    """
+
+    def __init__(self, directory: str | Path, max_entries: int = 2**22):
+        """
+        Args:
+            directory (str | Path): The directory of the cache, created if needed.
+            max_entries (int, optional): The maximum number of cached results per data type. Default is 2**22.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+
+    def get_path(self, dtype: numpy.dtype) -> Path:
+        """Returns the file of the keys and results of the given data type."""
+        return self.directory / f'{numpy.dtype(dtype).name}.npz'
+
+    def get_stamps_path(self, dtype: numpy.dtype) -> Path:
+        """Returns the file of the access stamps of the results of the given data type."""
+        return self.directory / f'{numpy.dtype(dtype).name}.accessed.npy'
+
+    def __len__(self) -> int:
+        """Returns the number of cached results, of every data type."""
+        total = 0
+
+        for path in self.directory.glob('*.npz'):
+            with numpy.load(path) as store:
+                total += len(store['keys'])
+
+        return total
+
+    def clear(self) -> None:
+        """Removes every cached result."""
+        for path in [*self.directory.glob('*.npz'), *self.directory.glob('*.accessed.npy')]:
+            path.unlink()
+
+    def load(self, dtype: numpy.dtype) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Returns the keys and results of the given data type.
+
+        Args:
+            dtype (numpy.dtype): The data type of the results.
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray]: The sorted keys and the results.
+        """
+        path = self.get_path(dtype)
+
+        if not path.exists():
+            return numpy.empty(0, dtype='S16'), numpy.empty(0, dtype=dtype)
+
+        with numpy.load(path) as store:
+            return store['keys'], store['values']
+
+    def load_stamps(self, dtype: numpy.dtype, n_entries: int, mmap_mode: str | None = None) -> numpy.ndarray | None:
+        """
+        Returns the access stamps of the results of the given data type.
+
+        Args:
+            dtype (numpy.dtype): The data type of the results.
+            n_entries (int): The number of stored results.
+            mmap_mode (str, optional): The memory-map mode, 'r+' to update the stamps in place. Default is to load them.
+
+        Returns:
+            numpy.ndarray | None: The stamps, None if they are missing or were replaced by a concurrent writer.
+        """
+        path = self.get_stamps_path(dtype)
+
+        if not path.exists():
+            return None
+
+        accessed = numpy.load(path, mmap_mode=mmap_mode)
+
+        return accessed if len(accessed) == n_entries else None
+
+    def save(self, keys: numpy.ndarray, values: numpy.ndarray, accessed: numpy.ndarray) -> None:
+        """
+        Atomically replaces the store of the results of the data type of the values.
+
+        Args:
+            keys (numpy.ndarray): The sorted keys.
+            values (numpy.ndarray): The results, one per key.
+            accessed (numpy.ndarray): The last access stamps, one per key.
+        """
+        for path, write in [
+            (self.get_stamps_path(values.dtype), lambda file: numpy.save(file, accessed)),
+            (self.get_path(values.dtype), lambda file: numpy.savez(file, keys=keys, values=values)),
+        ]:
+            temporary_path = path.with_suffix(f'.{os.getpid()}.tmp')
+
+            with open(temporary_path, 'wb') as file:
+                write(file)
+
+            os.replace(temporary_path, path)
+
+    @staticmethod
+    def get_stamp(accessed: numpy.ndarray | None) -> int:
+        """Returns an access stamp more recent than every given one."""
+        latest = 0 if accessed is None else int(numpy.max(accessed, initial=0))
+
+        return max(time.time_ns(), latest + 1)
+
+    @staticmethod
+    def get_function_key(func: Callable, key: str | None = None) -> bytes:
+        """
+        Returns the hash identifying a function, see `hash_function`, or the given key.
+
+        Args:
+            func (Callable): The function.
+            key (str, optional): An explicit key identifying the function and its version, for functions whose
+                behaviour depends on state which can not be hashed. Default is to hash the function.
+
+        Returns:
+            bytes: The hash of the function identity.
+
+        Raises:
+            TypeError: If the function can not be hashed and no key is given.
+        """
+        hasher = hashlib.blake2b(digest_size=16)
+
+        if key is not None:
+            hasher.update(f'key {key}'.encode())
+        else:
+            hash_function(hasher, func, seen=set())
+
+        return hasher.digest()
+
+    def get_keys(self, func: Callable, x_table: Table, key: str | None = None) -> numpy.ndarray:
+        """
+        Returns the key of every point of the grid, in flat order.
+
+        Args:
+            func (Callable): The evaluated function.
+            x_table (Table): The table of the X dimensions.
+            key (str, optional): An explicit key identifying the function. Default is to hash the function.
+
+        Returns:
+            numpy.ndarray: The 16 bytes keys of the points.
+        """
+        base = hashlib.blake2b(self.get_function_key(func, key=key), digest_size=16)
+
+        # The bytes of each parameter value are computed once, then joined for every point in flat order
+        axes_bytes = [[value.tobytes() for value in numpy.asarray(x.base_values)] for x in x_table]
+
+        keys = []
+        for point in itertools.product(*axes_bytes):
+            hasher = base.copy()
+            hasher.update(b''.join(point))
+            keys.append(hasher.digest())
+
+        return numpy.array(keys, dtype='S16')
+
+    def get(self, keys: numpy.ndarray, dtype: numpy.dtype) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Returns the cached results of the given keys, marking them as recently used.
+
+        Only the access stamps of the results found are written, in place, rather than the whole store.
+
+        Args:
+            keys (numpy.ndarray): The keys to look up.
+            dtype (numpy.dtype): The data type of the results.
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray]: The mask of the keys found, and their results.
+        """
+        stored_keys, stored_values = self.load(dtype)
+
+        if len(stored_keys) == 0:
+            return numpy.zeros(len(keys), dtype=bool), stored_values
+
+        positions = numpy.minimum(numpy.searchsorted(stored_keys, keys), len(stored_keys) - 1)
+        found = stored_keys[positions] == keys
+        positions = positions[found]
+
+        accessed = self.load_stamps(dtype, n_entries=len(stored_keys), mmap_mode='r+')
+
+        if len(positions) and accessed is not None:
+            accessed[positions] = self.get_stamp(accessed)
+            accessed.flush()
+
+        return found, stored_values[positions]
+
+    def put(self, keys: numpy.ndarray, values: numpy.ndarray) -> None:
+        """
+        Stores results in the cache, then evicts the least recently used ones beyond `max_entries`.
+
+        Args:
+            keys (numpy.ndarray): The keys of the results.
+            values (numpy.ndarray): The results, one per key.
+        """
+        stored_keys, stored_values = self.load(values.dtype)
+
+        accessed = self.load_stamps(values.dtype, n_entries=len(stored_keys))
+        accessed = numpy.zeros(len(stored_keys), dtype=numpy.int64) if accessed is None else accessed
+
+        # The new results replace the stored ones of the same keys
+        kept = ~numpy.isin(stored_keys, keys)
+        stamp = self.get_stamp(accessed)
+
+        keys = numpy.concatenate([stored_keys[kept], keys])
+        values = numpy.concatenate([stored_values[kept], values])
+        accessed = numpy.concatenate([accessed[kept], numpy.full(len(values) - kept.sum(), stamp)])
+
+        if len(keys) > self.max_entries:
+            recent = numpy.argsort(accessed, kind='stable')[len(keys) - self.max_entries:]
+            keys, values, accessed = keys[recent], values[recent], accessed[recent]
+
+        order = numpy.argsort(keys)
+        self.save(keys[order], values[order], accessed[order])
+
+    def evaluate(
+            self,
+            func: Callable,
+            x_table: Table,
+            out: numpy.ndarray,
+            key: str | None = None,
+            **kwargs) -> numpy.ndarray:
+        """
+        Fills the output buffer with the cached results, then evaluates and caches the missing points only.
+
+        Args:
+            func (Callable): The function, taking the values of the parameters in the order of the x_table.
+            x_table (Table): The table of the X dimensions.
+            out (numpy.ndarray): The preallocated buffer, of the shape of the table, to write the results into.
+            key (str, optional): An explicit key identifying the function. Default is to hash the function.
+            **kwargs: Additional keyword arguments passed to `evaluate` for the missing points.
+
+        Returns:
+            numpy.ndarray: The output buffer.
+        """
+        keys = self.get_keys(func, x_table, key=key)
+        found, values = self.get(keys, dtype=out.dtype)
+
+        flat_out = out.reshape(-1)
+        flat_out[found] = values
+
+        missing = numpy.flatnonzero(~found)
+
+        if len(missing):
+            evaluate(func, x_table, out=out, indices=missing, **kwargs)
+            self.put(keys[missing], flat_out[missing])
+
+        return out
+
+# -
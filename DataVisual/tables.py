@@ -1,11 +1,13 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from dataclasses import dataclass
-from typing import List, Union
+import numbers
+from dataclasses import dataclass, field
+from typing import Any, Iterator, List, Union
 from DataVisual.units import BaseUnit
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Table:
     """
     Represents a table of parameters (BaseUnits) for data visualization.
@@ -13,36 +15,162 @@ class Table:
     This class provides functionality to store, access, and manage a list of parameters
     used in data visualization, typically for x-axis or other multidimensional data.
 
+    The table is immutable and keeps the position of each parameter itself, rather than on the
+    parameters, so a same BaseUnit can be shared by several tables.
+
     Attributes:
     -----------
     parameters : List[BaseUnit]
-        A list of BaseUnit objects representing the parameters contained in the table.
+        A list of BaseUnit objects representing the parameters contained in the table, stored as a tuple.
     """
 
     parameters: List[BaseUnit]
+    _positions: dict = field(init=False, repr=False, compare=False)
+    _labels: dict = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """
-        Post-initialization to assign positional indices to each parameter.
+        Post-initialization to index the parameters by identity and by label.
+
+        This method builds the mappings from each parameter, and from its long and short labels,
+        to its position in the table, enabling constant time lookup of the axes.
+        """
+        parameters = tuple(self.parameters)
+
+        labels = {}
+        for idx, parameter in enumerate(parameters):
+            labels.setdefault(parameter.short_label, idx)
+            labels.setdefault(parameter.long_label, idx)
+
+        object.__setattr__(self, 'parameters', parameters)
+        object.__setattr__(self, '_positions', {id(parameter): idx for idx, parameter in enumerate(parameters)})
+        object.__setattr__(self, '_labels', labels)
+
+    def __reduce__(self) -> tuple:
+        """Pickles the table by its parameters only, the identity index being rebuilt on the receiving side."""
+        return Table, (self.parameters,)
+
+    def get_position(self, parameter: Union[BaseUnit, str]) -> int:
+        """
+        Returns the position of a parameter in the table.
+
+        Args:
+            parameter (Union[BaseUnit, str]): The parameter, or its long or short label.
+
+        Returns:
+            int: The position of the parameter.
 
-        This method assigns the index of each parameter in the list as its `position` attribute,
-        enabling easy reference to the order of parameters within the table.
+        Raises:
+            KeyError: If the parameter is not part of the table.
         """
-        for idx, parameter in enumerate(self.parameters):
-            parameter.position = idx
+        position = self._labels.get(parameter) if isinstance(parameter, str) else self._positions.get(id(parameter))
 
-    def __getitem__(self, index: Union[int, slice]) -> Union[BaseUnit, List[BaseUnit]]:
+        if position is None:
+            raise KeyError(f"The parameter {parameter} is not part of the table: {self}.")
+
+        return position
+
+    def __getitem__(self, index: Union[int, slice, str]) -> Union[BaseUnit, List[BaseUnit]]:
         """
         Enables direct indexing into the parameters list.
 
         Args:
-            index (Union[int, slice]): The index or slice to retrieve from the parameters list.
+            index (Union[int, slice, str]): The index or slice to retrieve from the parameters list,
+                or the long or short label of a parameter.
 
         Returns:
             Union[BaseUnit, List[BaseUnit]]: The parameter(s) at the specified index or slice.
         """
+        if isinstance(index, str):
+            return self.parameters[self.get_position(index)]
+
         return self.parameters[index]
 
+    def __iter__(self) -> Iterator[BaseUnit]:
+        """Iterates over the parameters."""
+        return iter(self.parameters)
+
+    def __len__(self) -> int:
+        """Returns the number of parameters."""
+        return len(self.parameters)
+
+    def __contains__(self, parameter: BaseUnit) -> bool:
+        """Returns whether the given parameter object is part of the table."""
+        return id(parameter) in self._positions
+
+    @staticmethod
+    def check_indexer(indexer: Any) -> None:
+        """
+        Checks that an indexer is an integer or a slice, the only selections the parameters support.
+
+        Args:
+            indexer (Any): The indexer of a parameter.
+
+        Raises:
+            TypeError: If the indexer is of another type, such as a list, an array or a boolean.
+        """
+        if isinstance(indexer, slice) or (isinstance(indexer, numbers.Integral) and not isinstance(indexer, bool)):
+            return
+
+        raise TypeError(f"Parameters can only be selected by an integer or a slice, got {indexer!r}.")
+
+    def get_selection(self, indexers: dict[Union[BaseUnit, str], Any]) -> list:
+        """
+        Converts indexers keyed by parameter, or parameter label, into a per-position list.
+
+        Args:
+            indexers (dict[Union[BaseUnit, str], Any]): The integer index or slice of some parameters.
+
+        Returns:
+            list: The indexer of every position, `slice(None)` for the parameters without indexer.
+
+        Raises:
+            TypeError: If an indexer is neither an integer nor a slice.
+        """
+        selection = [slice(None)] * len(self.parameters)
+
+        for parameter, indexer in indexers.items():
+            self.check_indexer(indexer)
+            selection[self.get_position(parameter)] = indexer
+
+        return selection
+
+    def select(self, selection: list[Union[int, slice]]) -> 'Table':
+        """
+        Returns the table of the parameters left by a per-position selection of integers and slices.
+
+        Parameters selected by an integer are dropped, those selected by a slice are replaced by a clone
+        whose base values are a view of the selected ones, and the others are reused as is.
+
+        Args:
+            selection (list[Union[int, slice]]): The integer index or slice of every position.
+
+        Returns:
+            Table: The new Table instance.
+
+        Raises:
+            TypeError: If an indexer is neither an integer nor a slice.
+        """
+        parameters = []
+
+        for parameter, indexer in zip(self.parameters, selection):
+            self.check_indexer(indexer)
+
+            if not isinstance(indexer, slice):
+                continue
+
+            if indexer != slice(None):
+                parameter = parameter.clone(base_values=parameter.base_values[indexer])
+
+            parameters.append(parameter)
+
+        return Table(parameters)
+
+    @property
+    def shape(self) -> tuple:
+        """Returns the shape of the grid spanned by the parameters."""
+        return tuple(parameter.size for parameter in self.parameters)
+
     def __repr__(self) -> str:
         """
         Returns a string representation of the Table.
@@ -52,4 +180,4 @@ class Table:
         Returns:
             str: A string representation of the parameters list.
         """
-        return str(self.parameters)
+        return str(list(self.parameters))
@@ -1,5 +1,39 @@
 import numpy
-from typing import Iterable
+from pickle import PickleBuffer
+
+from DataVisual import statistics
+
+
+def rebuild_unit(
+        cls: type,
+        state: dict,
+        base_values: numpy.ndarray | PickleBuffer,
+        dtype: numpy.dtype | None = None,
+        shape: tuple | None = None) -> 'BaseUnit':
+    """
+    Rebuilds a pickled unit, see `BaseUnit.__reduce_ex__`.
+
+    Args:
+        cls (type): The class of the unit.
+        state (dict): The slots of the unit, without its base values and the arrays derived from them.
+        base_values (numpy.ndarray | PickleBuffer): The base values, or their buffer with protocol 5.
+        dtype (numpy.dtype, optional): The data type of the buffer, None if the base values are an array.
+        shape (tuple, optional): The shape of the buffer, None if the base values are an array.
+
+    Returns:
+        BaseUnit: The unit, whose derived arrays are recomputed lazily from the base values.
+    """
+    unit = cls.__new__(cls)
+
+    for name, value in state.items():
+        setattr(unit, name, value)
+
+    if dtype is not None:
+        base_values = numpy.frombuffer(base_values, dtype=dtype).reshape(shape)
+
+    unit.base_values = base_values
+
+    return unit
 
 
 class UnitMeta(type):
@@ -40,6 +74,14 @@ class UnitMeta(type):
     ]
 
     def __new__(cls, clsname, bases, attrs):
+        # The class-level use_prefix and string_format are defaults of instance attributes, they must not shadow them
+        for name in ['use_prefix', 'string_format']:
+            if name in attrs:
+                attrs[f'default_{name}'] = attrs.pop(name)
+
+        # Unit instances only hold the slots declared by BaseUnit, without a per-instance __dict__
+        attrs.setdefault('__slots__', ())
+
         # Initialize the class as usual
         new_class = super().__new__(cls, clsname, bases, attrs)
 
@@ -55,7 +97,8 @@ class BaseUnit:
         long_label (str): Descriptive name of the unit.
         short_label (str): Abbreviated label of the unit.
         string_format (str): Python format specifier for converting numerical values to strings.
-        values (float | np.ndarray): The numerical values associated with this unit.
+        base_values (float | np.ndarray): The numerical values associated with this unit.
+        values (float | np.ndarray): The values scaled by the SI prefix, computed lazily from the base values.
         use_long_label_for_repr (bool): Flag indicating whether the long label should be used in the __repr__ output.
         use_prefix (bool): Determines whether SI prefixes are automatically used when representing values.
         value_representation (float | np.ndarray): Custom representation of the values, if any.
@@ -70,6 +113,27 @@ class BaseUnit:
         get_representation: Generates a formatted string representation for the unit and its values.
     """
 
+    __slots__ = (
+        'long_label',
+        'short_label',
+        'string_format',
+        'use_long_label_for_repr',
+        'value_representation',
+        'is_base',
+        'auto_scale',
+        '_use_prefix',
+        '_normalized',
+        '_base_values',
+        '_values',
+        '_prefix',
+        '_summary',
+        '_sorter',
+        '_representations',
+    )
+
+    # Slots derived from the base values, recomputed lazily rather than copied when pickling
+    derived_slots = ('_values', '_prefix', '_summary', '_sorter', '_representations')
+
     def __init__(
             self,
             long_label: str,
@@ -84,8 +148,8 @@ class BaseUnit:
 
         self.long_label = long_label if long_label is not None else self.long_label
         self.short_label = short_label if short_label is not None else long_label.lower().replace(' ', '_')
-        self.string_format = string_format if string_format is not None else self.string_format
-        self.use_prefix = use_prefix if use_prefix is not None else self.use_prefix
+        self.string_format = string_format if string_format is not None else self.default_string_format
+        self.use_prefix = use_prefix if use_prefix is not None else self.default_use_prefix
 
         self.use_long_label_for_repr = use_long_label_for_repr
 
@@ -96,38 +160,175 @@ class BaseUnit:
         self.set_base_values(base_values)
 
     def scale_values(self) -> None:
-        if not self.use_prefix:
-            self.long_prefix = ''
-            self.short_prefix = ''
-            self.values = self.base_values
-            return
+        """
+        Resets the cached prefix, scaled values and value representations.
 
-        if None in self.base_values or self.value_representation is not None:
-            self.long_prefix = ''
-            self.short_prefix = ''
-            return
+        They are recomputed lazily on their next access, so the scaled copy of the base values is only
+        allocated if `values` is actually used.
+        """
+        self._prefix = None
+        self._values = None
+        self._representations = {}
 
-        if self.normalized:
-            self.long_prefix = ''
-            self.short_prefix = ''
-            self.values = self.base_values / self.base_values.max()
-            return
+    @property
+    def base_values(self) -> numpy.ndarray:
+        """Returns the unscaled values of the unit."""
+        return self._base_values
+
+    @base_values.setter
+    def base_values(self, base_values: numpy.ndarray) -> None:
+        self._base_values = numpy.atleast_1d(base_values)
+        self._summary = None
+        self._sorter = None
+        self.scale_values()
+
+    @property
+    def summary(self) -> statistics.Summary:
+        """
+        Returns the summary statistics (min, max, abs-max, NaN count, mean, std) of the base values.
 
-        long_prefix, short_prefix = self.get_closest_prefix_string()
+        They are computed in a single chunked pass on first access and cached until the base values change,
+        then reused by the prefix selection, the normalization and the plot limits.
+        """
+        if self._summary is None:
+            self._summary = statistics.summarize(self.base_values)
 
-        multiplier = UnitMeta.prefixes[long_prefix]
+        return self._summary
 
-        self.long_prefix = long_prefix
+    def set_base_values(self, base_values: numpy.ndarray) -> None:
+        self.base_values = base_values
 
-        self.short_prefix = short_prefix
+    @property
+    def use_prefix(self) -> bool:
+        """Returns whether SI prefixes are used to scale and represent the values."""
+        return self._use_prefix
 
-        self.values = self.base_values * (multiplier ** -self.power)
+    @use_prefix.setter
+    def use_prefix(self, use_prefix: bool) -> None:
+        self._use_prefix = use_prefix
+        self.scale_values()
 
-    def set_base_values(self, base_values: numpy.ndarray) -> numpy.ndarray:
-        self.base_values = numpy.atleast_1d(base_values)
+    @property
+    def normalized(self) -> bool:
+        """Returns whether the values are normalized by their maximum."""
+        return self._normalized
 
+    @normalized.setter
+    def normalized(self, normalized: bool) -> None:
+        self._normalized = normalized
         self.scale_values()
 
+    def _is_scalable(self) -> bool:
+        """Returns whether the values can be scaled, i.e. are numerical and have no custom representation."""
+        has_missing_values = self.base_values.dtype == object and None in self.base_values
+
+        return not has_missing_values and self.value_representation is None
+
+    def _get_prefix(self) -> tuple[str, str]:
+        """Returns the long and short SI prefix of the values, computed on first access."""
+        if self._prefix is None:
+            if self.use_prefix and not self.normalized and self._is_scalable():
+                self._prefix = self.get_closest_prefix_string()
+            else:
+                self._prefix = ('', '')
+
+        return self._prefix
+
+    @property
+    def long_prefix(self) -> str:
+        """Returns the long form of the SI prefix of the values."""
+        return self._get_prefix()[0]
+
+    @property
+    def short_prefix(self) -> str:
+        """Returns the short form of the SI prefix of the values."""
+        return self._get_prefix()[1]
+
+    @property
+    def scale_factor(self) -> float:
+        """
+        Returns the factor converting the base values to the scaled values, given the SI prefix
+        or the normalization. Applying it to a slice avoids scaling the whole array.
+
+        Values whose maximum is zero or not finite, such as all-zero or all-NaN values, are left unscaled
+        when normalized.
+        """
+        if not self.use_prefix or not self._is_scalable():
+            return 1
+
+        if self.normalized:
+            maximum = self.summary.maximum
+            return 1 / maximum if numpy.isfinite(maximum) and maximum != 0 else 1
+
+        return UnitMeta.prefixes[self.long_prefix] ** -self.power
+
+    @property
+    def values(self) -> numpy.ndarray:
+        """Returns the values scaled by the SI prefix or normalized, computed on first access and cached."""
+        if self._values is None:
+            scale_factor = self.scale_factor
+
+            self._values = self.base_values if scale_factor == 1 else self.base_values * scale_factor
+
+        return self._values
+
+    def clone(self, base_values: numpy.ndarray | None = None, **attributes) -> 'BaseUnit':
+        """
+        Returns a copy of the unit that shares its arrays instead of duplicating them.
+
+        Only the label, prefix and flag metadata are copied. If new base values or attributes
+        are provided, the values of the copy are scaled again accordingly.
+
+        Args:
+            base_values (numpy.ndarray, optional): New base values for the copy. Default is to share the current ones.
+            **attributes: Attributes to override on the copy, such as `normalized`.
+
+        Returns:
+            BaseUnit: The new unit instance.
+        """
+        new_unit = type(self).__new__(type(self))
+
+        for name in BaseUnit.__slots__:
+            if hasattr(self, name):
+                setattr(new_unit, name, getattr(self, name))
+
+        for name, value in attributes.items():
+            setattr(new_unit, name, value)
+
+        if base_values is not None:
+            new_unit.set_base_values(base_values)
+        elif attributes:
+            new_unit.scale_values()
+
+        return new_unit
+
+    def __reduce_ex__(self, protocol: int) -> tuple:
+        """
+        Pickles the unit without the arrays derived from its base values, which are recomputed on the receiving side.
+
+        With protocol 5 the base values are handed to pickle as a PickleBuffer, so they can travel out-of-band
+        without being copied, e.g. with a `buffer_callback`. Non-contiguous base values are made contiguous first.
+
+        Args:
+            protocol (int): The pickle protocol.
+
+        Returns:
+            tuple: The function rebuilding the unit and its arguments.
+        """
+        state = {
+            name: getattr(self, name) for name in BaseUnit.__slots__
+            if name != '_base_values' and name not in self.derived_slots and hasattr(self, name)
+        }
+
+        base_values = self.base_values
+
+        if protocol < 5 or base_values.dtype.hasobject:
+            return rebuild_unit, (type(self), state, base_values)
+
+        base_values = numpy.ascontiguousarray(base_values)
+
+        return rebuild_unit, (type(self), state, PickleBuffer(base_values), base_values.dtype, base_values.shape)
+
     def __repr__(self) -> str:
         """Returns a string representation of the BaseUnit instance."""
         unit_representation = self.get_unit()
@@ -141,6 +342,60 @@ class BaseUnit:
         """Returns the unit, considering if it's normalized."""
         return "A.U." if self.normalized else self.unit
 
+    def _get_sorter(self) -> numpy.ndarray | None:
+        """
+        Returns the indices sorting the base values, None if they are already sorted, computed on first
+        access and cached until the base values change.
+        """
+        if self._sorter is None:
+            is_sorted = numpy.all(self.base_values[1:] >= self.base_values[:-1])
+
+            self._sorter = False if is_sorted else numpy.argsort(self.base_values, kind='stable')
+
+        return None if self._sorter is False else self._sorter
+
+    def get_index(self, value: float | slice, method: str | None = 'nearest') -> int | slice:
+        """
+        Returns the index of a value, or the slice of a range of values, in the base values by binary search.
+
+        Args:
+            value (float | slice): The value to look up, or a slice of values whose bounds are both included.
+            method (str, optional): 'nearest' returns the index of the closest value, None requires an exact match.
+                Default is 'nearest'.
+
+        Returns:
+            int | slice: The index of the value, or the slice of indices of the range of values.
+
+        Raises:
+            KeyError: If method is None and the value is not part of the base values.
+            ValueError: If a slice of values is requested on unsorted base values, or the method is unknown.
+        """
+        if method not in ('nearest', None):
+            raise ValueError(f"Unknown method {method!r}, expected 'nearest' or None.")
+
+        sorter = self._get_sorter()
+
+        if isinstance(value, slice):
+            if sorter is not None:
+                raise ValueError(f"Selecting a range of values requires sorted base values for {self}.")
+
+            start = 0 if value.start is None else numpy.searchsorted(self.base_values, value.start, side='left')
+            stop = self.size if value.stop is None else numpy.searchsorted(self.base_values, value.stop, side='right')
+
+            return slice(int(start), int(stop), value.step)
+
+        sorted_values = self.base_values if sorter is None else self.base_values[sorter]
+
+        index = int(numpy.clip(numpy.searchsorted(sorted_values, value), 1, self.size - 1)) if self.size > 1 else 0
+
+        if self.size > 1 and abs(sorted_values[index - 1] - value) <= abs(sorted_values[index] - value):
+            index -= 1
+
+        if method is None and sorted_values[index] != value:
+            raise KeyError(f"The value {value} is not part of the values of {self}.")
+
+        return int(index if sorter is None else sorter[index])
+
     @property
     def size(self) -> int:
         """Returns the number of values."""
@@ -149,7 +404,7 @@ class BaseUnit:
     @property
     def shape(self) -> tuple:
         """Returns the shape of the values."""
-        return numpy.shape(self.values)
+        return numpy.shape(self.base_values)
 
     @staticmethod
     def closest_prefix_order(order_of_magnitude: float) -> str:
@@ -185,12 +440,17 @@ class BaseUnit:
         """
         Determines the closest SI prefix string for the current values.
 
+        The prefix is chosen from the largest absolute value, ignoring NaN values.
+
         Returns:
             tuple[str, str]: A tuple containing the long and short forms of the closest SI prefix.
         """
-        base_value = numpy.max(self.base_values) if isinstance(self.base_values, Iterable) else self.base_values
+        base_value = self.summary.abs_maximum
+
+        if numpy.isnan(base_value):
+            return "base", UnitMeta.prefix_to_string["base"]
 
-        magnitude = numpy.log10(abs(base_value)) / self.power
+        magnitude = numpy.log10(base_value) / self.power
 
         prefix = self.closest_prefix_order(magnitude)
 
@@ -230,6 +490,39 @@ class BaseUnit:
 
         return representation
 
+    def get_representations(
+            self,
+            add_unit: bool = False,
+            use_short_repr: bool = False,
+            use_prefix: bool = True) -> numpy.ndarray:
+        """
+        Generates the representation of every value at once, equivalent to calling `get_representation`
+        with each index.
+
+        The result is cached on the unit until its values or prefix change.
+
+        Args:
+            add_unit (bool, optional): Flag to include the unit in the representation.
+            use_short_repr (bool, optional): Flag to use the short label instead of the long label.
+            use_prefix (bool, optional): Flag to use SI prefixes in the value representation.
+
+        Returns:
+            numpy.ndarray: The formatted string representations, as an array of strings shaped like the values.
+        """
+        label = self._choose_label(use_short_repr)
+        key = (label, self.string_format, add_unit, use_prefix)
+
+        if key not in self._representations:
+            values = self.value_representation if self.value_representation is not None else self.values
+            unit = self._get_unit_string(add_unit, use_prefix)
+            suffix = f" [{unit}]" if add_unit and unit not in ['', 'base'] else ''
+
+            representations = [f"{label}: {value:{self.string_format}}{suffix}" for value in numpy.ravel(values)]
+
+            self._representations[key] = numpy.array(representations, dtype=object).reshape(numpy.shape(values))
+
+        return self._representations[key]
+
     def _choose_label(self, use_short_repr: bool) -> str:
         """Selects the appropriate label based on user preference."""
         label = self.short_label if use_short_repr else self.long_label
@@ -1,9 +1,12 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import pickle
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch
 import numpy as np
 import pytest
+from matplotlib.collections import LineCollection
 from DataVisual import Array, Table
 from DataVisual.units import Length, Power, Area
 
@@ -104,6 +107,41 @@ def test_plot_line(mock_show, mock_x_table_2, mock_measure_2):
     data.plot(x=mock_x_table_2[1])
 
 
+def test_plot_single_axis(mock_x_table_2):
+    """
+    Test the line plot of an Array with a single x dimension, drawn as one curve.
+
+    Args:
+        mock_x_table_2 (Table): Fixture providing the x_table with two parameters.
+    """
+    x_table = Table([mock_x_table_2[0]])
+    data = Array(x_table=x_table, y=Power(long_label='Power', base_values=np.random.rand(10)))
+
+    figure = data.render(x=x_table[0])
+    assert len(figure.axes[0].lines) == 1
+
+
+def test_plot_batched_line(mock_x_table_3, mock_measure_3):
+    """
+    Test that the batched rendering draws all the curves as a single LineCollection with a capped legend.
+
+    Args:
+        mock_x_table_3 (Table): Fixture providing the x_table with three parameters.
+        mock_measure_3 (Power): Fixture providing the y data as a Power object.
+    """
+    data = Array(x_table=mock_x_table_3, y=mock_measure_3)
+
+    ax = data.render(x=mock_x_table_3[1], batched=True).axes[0]
+
+    collections = [artist for artist in ax.collections if isinstance(artist, LineCollection)]
+    assert len(collections) == 1 and len(ax.lines) == 0
+    assert len(collections[0].get_segments()) == 10 * 10
+
+    legend = [text.get_text() for text in ax.get_legend().get_texts()]
+    assert len(legend) == Array.max_legend_entries + 1
+    assert legend[-1] == '(100 curves)'
+
+
 @patch("matplotlib.pyplot.show")
 def test_plot_std_line(mock_show, mock_x_table_3, mock_measure_3):
     """
@@ -119,6 +157,42 @@ def test_plot_std_line(mock_show, mock_x_table_3, mock_measure_3):
     data.plot(x=parameter_1, std=parameter_2)
 
 
+@patch("matplotlib.pyplot.show")
+def test_plot_quantile_line(mock_show, mock_x_table_3, mock_measure_3):
+    """
+    Test plotting with quantile band shading in the Array class.
+
+    Args:
+        mock_show (MagicMock): Mocked version of plt.show to prevent actual plot display.
+        mock_x_table_3 (Table): Fixture providing the x_table with three parameters.
+        mock_measure_3 (Power): Fixture providing the y data as a Power object.
+    """
+    parameter_1, parameter_2 = mock_x_table_3[1], mock_x_table_3[2]
+    data = Array(x_table=mock_x_table_3, y=mock_measure_3)
+    data.plot(x=parameter_1, std=parameter_2, band='quantile', quantiles=(0.1, 0.5, 0.9))
+
+
+def test_quantile(mock_x_table_3, mock_measure_3):
+    """
+    Test that the quantiles along one or several axes match the numpy reference implementation.
+
+    Args:
+        mock_x_table_3 (Table): Fixture providing the x_table with three parameters.
+        mock_measure_3 (Power): Fixture providing the y data as a Power object.
+    """
+    parameter_0, parameter_1, parameter_2 = mock_x_table_3
+    data = Array(x_table=mock_x_table_3, y=mock_measure_3)
+
+    median = data.quantile(axis=parameter_1, q=0.5)
+    assert list(median.x_table) == [parameter_0, parameter_2]
+    np.testing.assert_allclose(median.y.base_values, np.median(mock_measure_3.base_values, axis=1))
+
+    low, high = data.quantile(axis=[parameter_0, 'Area: 1'], q=[0.05, 0.95])
+    expected = np.quantile(mock_measure_3.base_values, [0.05, 0.95], axis=(0, 2))
+    np.testing.assert_allclose(low.y.base_values, expected[0])
+    np.testing.assert_allclose(high.y.base_values, expected[1])
+
+
 @patch("matplotlib.pyplot.show")
 def test_mean_plot_line(mock_show, mock_x_table_3, mock_measure_3):
     """
@@ -164,6 +238,205 @@ def test_rsd_plot_line(mock_show, mock_x_table_3, mock_measure_3):
     data.plot(x=parameter_1)
 
 
+def test_curve_labels(mock_x_table_3, mock_measure_3):
+    """
+    Test that the precomputed curve labels match the per-curve labels of get_diff_label.
+
+    Args:
+        mock_x_table_3 (Table): Fixture providing the x_table with three parameters.
+        mock_measure_3 (Power): Fixture providing the y data as a Power object.
+    """
+    data = Array(x_table=mock_x_table_3, y=mock_measure_3)
+
+    _, indices = data._get_curves(mock_measure_3.values, x_position=1)
+    labels = data.get_curve_labels(indices)
+
+    for index, label in zip(indices, labels):
+        slicer = tuple(slice(None) if idx < 0 else idx for idx in index)
+        assert label == data.get_diff_label(slicer=slicer)
+
+
+def test_table_lookup(mock_x_table_3, mock_measure_3):
+    """
+    Test the label lookup of Table and that units shared between Tables keep their position in each of them.
+
+    Args:
+        mock_x_table_3 (Table): Fixture providing the x_table with three parameters.
+        mock_measure_3 (Power): Fixture providing the y data as a Power object.
+    """
+    parameter_0, parameter_1, parameter_2 = mock_x_table_3
+
+    assert mock_x_table_3['Length: 1'] is parameter_1
+    assert mock_x_table_3['A: 1'] is parameter_2
+
+    data = Array(x_table=mock_x_table_3, y=mock_measure_3)
+    reduced = data.mean(axis='Length: 0')
+
+    assert reduced.x_table[0] is parameter_1
+    assert reduced.x_table.get_position(parameter_1) == 0
+    assert data.x_table.get_position(parameter_1) == 1
+
+    with pytest.raises(KeyError):
+        reduced.x_table.get_position(parameter_0)
+
+
+def test_isel_sel(mock_x_table_3, mock_measure_3):
+    """
+    Test selections by index and by value, which must return views of the y values and sliced Tables.
+
+    Args:
+        mock_x_table_3 (Table): Fixture providing the x_table with three parameters.
+        mock_measure_3 (Power): Fixture providing the y data as a Power object.
+    """
+    parameter_0, parameter_1, parameter_2 = mock_x_table_3
+    data = Array(x_table=mock_x_table_3, y=mock_measure_3)
+    values = mock_measure_3.base_values
+
+    selection = data.isel({parameter_0: 3, 'Length: 1': slice(2, 6)})
+
+    assert np.shares_memory(selection.y.base_values, values)
+    np.testing.assert_array_equal(selection.y.base_values, values[3, 2:6])
+    np.testing.assert_array_equal(selection.x_table[0].base_values, parameter_1.base_values[2:6])
+    assert selection.x_table[1] is parameter_2
+
+    selection = data.sel({parameter_0: 0.35, parameter_2: slice(0.2, 0.6)})
+
+    np.testing.assert_array_equal(selection.y.base_values, values[3, :, 2:6])
+    np.testing.assert_array_equal(selection.x_table[1].base_values, parameter_2.base_values[2:6])
+
+    with pytest.raises(KeyError):
+        data.sel({parameter_0: 0.35}, method=None)
+
+    unsorted = Length(base_values=np.array([3., 1., 2.]), long_label='Unsorted')
+    assert unsorted.get_index(1.8) == 2
+    assert unsorted.get_index(10) == 0
+
+    with pytest.raises(ValueError):
+        unsorted.get_index(slice(1, 2))
+
+    with pytest.raises(ValueError):
+        unsorted.get_index(1.8, method='pad')
+
+    for indexer in ([0, 2], np.array([0, 2]), True, 1.5):
+        with pytest.raises(TypeError):
+            data.isel({parameter_0: indexer})
+
+    assert data.isel({parameter_0: np.int64(3)}).x_table[0] is parameter_1
+
+
+def test_multi_axis_stats(mock_x_table_3, mock_measure_3):
+    """
+    Test that reductions over several axes at once match the numpy reference and reduce the Table.
+
+    Args:
+        mock_x_table_3 (Table): Fixture providing the x_table with three parameters.
+        mock_measure_3 (Power): Fixture providing the y data as a Power object.
+    """
+    parameter_0, parameter_1, parameter_2 = mock_x_table_3
+    data = Array(x_table=mock_x_table_3, y=mock_measure_3)
+
+    mean, std, rsd = data.stats(axis=[parameter_0, parameter_2])
+
+    values = mock_measure_3.base_values
+    np.testing.assert_allclose(mean.y.base_values, values.mean(axis=(0, 2)))
+    np.testing.assert_allclose(std.y.base_values, values.std(axis=(0, 2)))
+    np.testing.assert_allclose(rsd.y.base_values, values.std(axis=(0, 2)) / values.mean(axis=(0, 2)))
+    np.testing.assert_allclose(data.mean(axis=[parameter_0, parameter_2]).y.base_values, mean.y.base_values)
+
+    assert list(mean.x_table) == [parameter_1]
+
+
+def test_rsd_is_dimensionless(mock_x_table_3, mock_measure_3):
+    """
+    Test that the RSD, however computed, has a dimensionless y unit whose values are not rescaled by an SI prefix.
+
+    Args:
+        mock_x_table_3 (Table): Fixture providing the x_table with three parameters.
+        mock_measure_3 (Power): Fixture providing the y data as a Power object.
+    """
+    parameter_0 = mock_x_table_3[0]
+    data = Array(x_table=mock_x_table_3, y=mock_measure_3)
+
+    for rsd in (data.rsd(axis=parameter_0), data.stats(axis=parameter_0)[2], data.lazy().rsd(parameter_0).compute()):
+        assert rsd.y.unit == '' and not rsd.y.use_prefix
+        assert rsd.y.scale_factor == 1
+        assert rsd.y.long_label == 'RSD of Arbitrary measure'
+        np.testing.assert_array_equal(rsd.y.values, rsd.y.base_values)
+
+    assert data.mean(axis=parameter_0).y.unit == mock_measure_3.unit
+
+
+def test_lazy_chain(mock_x_table_3, mock_measure_3):
+    """
+    Test that a lazy chain of reductions fuses consecutive means and matches the eager result.
+
+    Args:
+        mock_x_table_3 (Table): Fixture providing the x_table with three parameters.
+        mock_measure_3 (Power): Fixture providing the y data as a Power object.
+    """
+    parameter_0, parameter_1, parameter_2 = mock_x_table_3
+    data = Array(x_table=mock_x_table_3, y=mock_measure_3)
+
+    lazy = data.lazy().mean(parameter_0).mean(parameter_1).std(parameter_2)
+
+    assert lazy.get_fused_operations() == [('mean', (parameter_0, parameter_1)), ('std', (parameter_2,))]
+
+    expected = mock_measure_3.base_values.mean(axis=(0, 1)).std()
+    np.testing.assert_allclose(lazy.y.base_values, expected)
+
+    with pytest.raises(ValueError):
+        data.lazy().mean(parameter_0).std(parameter_0)
+
+
+def test_render_threads(mock_x_table_3, mock_measure_3):
+    """
+    Test that Figures render to PNG bytes concurrently from several threads, without modifying the units.
+
+    Args:
+        mock_x_table_3 (Table): Fixture providing the x_table with three parameters.
+        mock_measure_3 (Power): Fixture providing the y data as a Power object.
+    """
+    parameter_0, parameter_1, parameter_2 = mock_x_table_3
+    data = Array(x_table=mock_x_table_3, y=mock_measure_3)
+
+    specs = [dict(x=parameter_1), dict(x='Length: 1', std=parameter_2), dict(x=parameter_1, normalize=True)] * 4
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        images = list(executor.map(lambda spec: data.to_png(dpi=50, **spec), specs))
+
+    assert all(image.startswith(b'\x89PNG') for image in images)
+    assert not parameter_1.is_base and not parameter_2.is_base
+    assert not mock_measure_3.normalized
+
+    figure = data.render(x=parameter_1, figsize=(4, 3))
+    assert tuple(figure.get_size_inches()) == (4, 3)
+
+
+def test_pickle_out_of_band(mock_x_table_3, mock_measure_3):
+    """
+    Test that an Array pickled with protocol 5 sends its values as out-of-band buffers, without copying them.
+
+    Args:
+        mock_x_table_3 (Table): Fixture providing the x_table with three parameters.
+        mock_measure_3 (Power): Fixture providing the y data as a Power object.
+    """
+    data = Array(x_table=mock_x_table_3, y=mock_measure_3)
+    _ = data.y.values, data.y.summary
+
+    buffers = []
+    payload = pickle.dumps(data, protocol=5, buffer_callback=buffers.append)
+
+    assert len(buffers) == 4
+    assert len(payload) < mock_measure_3.base_values.nbytes
+
+    new_data = pickle.loads(payload, buffers=buffers)
+
+    assert new_data.y._values is None
+    assert np.shares_memory(new_data.y.base_values, mock_measure_3.base_values)
+    assert new_data.x_table.get_position(new_data.x_table[1]) == 1
+    np.testing.assert_array_equal(new_data.mean(axis='Length: 0').y.base_values, data.mean(axis='Length: 0').y.base_values)
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
 
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import asyncio
+import numpy as np
+import pytest
+from DataVisual import AsyncSweep, Table
+from DataVisual.units import Length, Power
+
+
+@pytest.fixture
+def mock_x_table() -> Table:
+    """
+    Fixture to create a mock Table with two Length parameters.
+
+    Returns:
+        Table: A Table object containing two Length parameters.
+    """
+    parameter_0 = Length(base_values=np.linspace(0, 1, 4), long_label='Length 0')
+    parameter_1 = Length(base_values=np.linspace(0, 2, 5), long_label='Length 1')
+
+    return Table([parameter_0, parameter_1])
+
+
+def test_async_sweep(mock_x_table):
+    """
+    Test that the points are evaluated with at most `concurrency` evaluations in flight.
+
+    Args:
+        mock_x_table (Table): Fixture providing the x_table with two parameters.
+    """
+    in_flight, peak = 0, 0
+
+    async def func(length_0, length_1):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        return length_0 * length_1
+
+    sweep = AsyncSweep(func, mock_x_table, y=Power(long_label='Power'), concurrency=3)
+    data = asyncio.run(sweep.run())
+
+    assert peak == 3
+    assert sweep.n_done == 20
+    np.testing.assert_allclose(data.y.base_values, np.outer(mock_x_table[0].base_values, mock_x_table[1].base_values))
+
+
+def test_async_sweep_cancel(mock_x_table):
+    """
+    Test that a cancelled sweep keeps its partial results, NaN for the pending points, and can be resumed.
+
+    Args:
+        mock_x_table (Table): Fixture providing the x_table with two parameters.
+    """
+    async def func(length_0, length_1):
+        await asyncio.sleep(0 if length_0 < 0.5 else 10)
+        return length_0 + length_1
+
+    sweep = AsyncSweep(func, mock_x_table, y=Power(long_label='Power'), concurrency=2)
+
+    async def cancel_sweep():
+        task = asyncio.ensure_future(sweep.run())
+        await asyncio.sleep(0.05)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_sweep())
+
+    partial = sweep.build().y.base_values
+    expected = np.add.outer(mock_x_table[0].base_values, mock_x_table[1].base_values)
+
+    assert sweep.n_done == 10
+    np.testing.assert_allclose(partial[:2], expected[:2])
+    assert np.all(np.isnan(partial[2:]))
+
+    async def fast(length_0, length_1):
+        return length_0 + length_1
+
+    sweep.func = fast
+    np.testing.assert_allclose(asyncio.run(sweep.run()).y.base_values, expected)
+
+
+def test_async_sweep_error(mock_x_table):
+    """
+    Test that an error of one evaluation cancels the others and is raised.
+
+    Args:
+        mock_x_table (Table): Fixture providing the x_table with two parameters.
+    """
+    async def func(length_0, length_1):
+        if length_1 == 1:
+            raise RuntimeError("Simulator failure")
+        await asyncio.sleep(10 * length_1)
+        return length_0
+
+    sweep = AsyncSweep(func, mock_x_table, y=Power(long_label='Power'), concurrency=4)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(asyncio.wait_for(sweep.run(), timeout=5))
+
+    assert sweep.n_done == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+
+# -
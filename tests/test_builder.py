@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pytest
+from DataVisual import ArrayBuilder, Table
+from DataVisual.units import Length, Power
+
+
+@pytest.mark.parametrize("capacity", [None, 1], ids=['preallocated', 'growing'])
+@pytest.mark.parametrize("axis_index", [0, 1], ids=['outermost', 'inner'])
+def test_array_builder(capacity: int, axis_index: int):
+    """
+    Test that slices appended one at a time build the same Array and running statistics as the stacked slices.
+
+    Args:
+        capacity (int): The number of preallocated slices, provided by pytest's parameterization.
+        axis_index (int): The position of the append axis, provided by pytest's parameterization.
+    """
+    parameter_0 = Length(base_values=np.linspace(0, 1, 6), long_label='Length 0')
+    parameter_1 = Length(base_values=np.linspace(0, 1, 4), long_label='Length 1')
+    x_table = Table([parameter_0, parameter_1])
+    axis = x_table[axis_index]
+
+    builder = ArrayBuilder(x_table=x_table, y=Power(long_label='Power'), axis=axis, capacity=capacity)
+
+    slices = [np.random.rand(x_table[1 - axis_index].size) for _ in range(axis.size)]
+    for values in slices:
+        builder.append(values)
+
+    expected = np.stack(slices, axis=axis_index)
+
+    np.testing.assert_allclose(builder.mean, expected.mean(axis=axis_index))
+    np.testing.assert_allclose(builder.std, expected.std(axis=axis_index))
+
+    data = builder.build()
+
+    assert np.shares_memory(data.y.base_values, builder._buffer)
+    np.testing.assert_array_equal(data.y.base_values, expected)
+    np.testing.assert_array_equal(data.x_table[axis_index].base_values, axis.base_values)
+
+    with pytest.raises(ValueError):
+        builder.append(np.zeros(3))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+
+# -
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from unittest.mock import patch
+import numpy as np
+import pytest
+from DataVisual import Array, Table
+from DataVisual.downsampling import minmax, lttb
+from DataVisual.units import Length, Power
+
+
+@pytest.fixture
+def mock_curves() -> tuple[np.ndarray, np.ndarray]:
+    """
+    Fixture to create long random walks sharing the same x values.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The x values and the (n_curves, n_x) curves.
+    """
+    x = np.linspace(0, 1, 10_001)
+    y = np.cumsum(np.random.randn(5, x.size), axis=-1)
+
+    return x, y
+
+
+def test_minmax(mock_curves):
+    """
+    Test that the min-max decimation keeps the extrema of every curve, with increasing x values.
+
+    Args:
+        mock_curves (tuple): Fixture providing the x values and curves.
+    """
+    x, y = mock_curves
+
+    x_out, y_out = minmax(x, y, n_out=200)
+
+    assert x_out.shape == y_out.shape == (5, 200)
+    assert np.all(np.diff(x_out, axis=-1) >= 0)
+    np.testing.assert_array_equal(y_out.min(axis=-1), y.min(axis=-1))
+    np.testing.assert_array_equal(y_out.max(axis=-1), y.max(axis=-1))
+
+
+def test_lttb(mock_curves):
+    """
+    Test that the LTTB decimation keeps the end points of every curve and picks existing points in x order.
+
+    Args:
+        mock_curves (tuple): Fixture providing the x values and curves.
+    """
+    x, y = mock_curves
+
+    x_out, y_out = lttb(x, y, n_out=200)
+
+    assert x_out.shape == y_out.shape == (5, 200)
+    assert np.all(np.diff(x_out, axis=-1) > 0)
+    np.testing.assert_array_equal(y_out[:, [0, -1]], y[:, [0, -1]])
+
+    indices = np.searchsorted(x, x_out)
+    np.testing.assert_array_equal(np.take_along_axis(y, indices, axis=-1), y_out)
+
+
+@pytest.mark.parametrize("method", ['minmax', 'lttb'])
+@pytest.mark.parametrize("batched", [True, False], ids=['batched', 'per-line'])
+@patch("matplotlib.pyplot.show")
+def test_plot_downsampled(mock_show, mock_curves, method: str, batched: bool):
+    """
+    Test plotting long curves with decimation.
+
+    Args:
+        mock_show (MagicMock): Mocked version of plt.show to prevent actual plot display.
+        mock_curves (tuple): Fixture providing the x values and curves.
+        method (str): The decimation method, provided by pytest's parameterization.
+        batched (bool): Whether the curves are batched, provided by pytest's parameterization.
+    """
+    x, y = mock_curves
+
+    parameter_0 = Length(base_values=np.arange(5), long_label='Index')
+    parameter_1 = Length(base_values=x, long_label='Length')
+
+    data = Array(x_table=Table([parameter_0, parameter_1]), y=Power(long_label='Power', base_values=y))
+    data.plot(x=parameter_1, downsample=method, batched=batched)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+
+# -
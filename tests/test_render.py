@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pytest
+from DataVisual import Array, Table, render_many
+from DataVisual.units import Length, Power, Area
+
+
+@pytest.fixture
+def mock_arrays() -> list[Array]:
+    """
+    Fixture to create a few mock Arrays with two Length parameters and one Area parameter.
+
+    Returns:
+        list[Array]: The Arrays, with random Power values.
+    """
+    parameter_0 = Length(base_values=np.linspace(0, 1, 3), long_label='Length 0', short_label='L0')
+    parameter_1 = Length(base_values=np.linspace(0, 1, 20), long_label='Length 1', short_label='L1')
+    parameter_2 = Area(base_values=np.linspace(0, 1, 4), long_label='Area 0', short_label='A0')
+
+    x_table = Table([parameter_0, parameter_1, parameter_2])
+
+    return [
+        Array(x_table=x_table, y=Power(long_label='Power', base_values=np.random.rand(3, 20, 4))) for _ in range(3)
+    ]
+
+
+@pytest.mark.parametrize("workers", [1, 2], ids=['serial', 'process pool'])
+def test_render_many(tmp_path, mock_arrays, workers: int):
+    """
+    Test that every Array is rendered to its own image file.
+
+    Args:
+        tmp_path (Path): Temporary directory to write the images to.
+        mock_arrays (list[Array]): Fixture providing the Arrays to render.
+        workers (int): The number of worker processes, provided by pytest's parameterization.
+    """
+    specs = [
+        dict(x='Length 1'),
+        dict(x='Length 1', std='Area 0'),
+        dict(x='L1', batched=True, filename='batched.svg'),
+    ]
+
+    paths = render_many(mock_arrays, specs, out_dir=tmp_path, workers=workers)
+
+    assert [path.name for path in paths] == ['00000.png', '00001.png', 'batched.svg']
+    assert all(path.stat().st_size > 0 for path in paths)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+
+# -
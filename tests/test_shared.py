@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import gc
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pytest
+from DataVisual import Array, SharedArray, SharedArrayHandle, Table
+from DataVisual.units import Length, Power
+
+
+def fill_row(handle: SharedArrayHandle, row: int) -> None:
+    """Worker writing one row of the shared values in place, defined at the top level so it can be pickled."""
+    with handle.attach() as shared:
+        parameter_0, parameter_1 = shared.x_table
+        shared[row] = parameter_0.base_values[row] * parameter_1.base_values
+
+
+@pytest.fixture
+def mock_x_table() -> Table:
+    """
+    Fixture to create a mock Table with two Length parameters.
+
+    Returns:
+        Table: A Table object containing two Length parameters.
+    """
+    parameter_0 = Length(base_values=np.linspace(0, 1, 6), long_label='Length 0')
+    parameter_1 = Length(base_values=np.linspace(0, 2, 50), long_label='Length 1')
+
+    return Table([parameter_0, parameter_1])
+
+
+def test_shared_array(mock_x_table):
+    """
+    Test that worker processes fill one shared buffer in place from a lightweight handle.
+
+    Args:
+        mock_x_table (Table): Fixture providing the x_table with two parameters.
+    """
+    with SharedArray(mock_x_table, y=Power(long_label='Power')) as shared:
+        handle = shared.handle
+        assert len(pickle.dumps(handle)) < shared.values.nbytes
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            list(executor.map(fill_row, [handle] * 6, range(6)))
+
+        data = Array.from_shared(shared)
+
+    np.testing.assert_allclose(data.y.base_values, np.outer(mock_x_table[0].base_values, mock_x_table[1].base_values))
+    assert data.y.long_label == 'Power'
+
+    with pytest.raises(FileNotFoundError):
+        handle.attach()
+
+
+def test_shared_views_outlive_close(mock_x_table):
+    """
+    Test that views of the shared values stay valid once the SharedArray is closed or garbage collected.
+
+    Args:
+        mock_x_table (Table): Fixture providing the x_table with two parameters.
+    """
+    with SharedArray(mock_x_table, y=Power(long_label='Power')) as shared:
+        shared[...] = 2
+        view = shared.values[1:]
+
+    assert view.sum() == 2 * view.size
+
+    shared = SharedArray(mock_x_table, y=Power(long_label='Power'))
+    shared[...] = 3
+    data = Array.from_shared(shared, copy=False)
+
+    shared.close()
+    del shared
+    gc.collect()
+
+    assert data.y.base_values.sum() == 3 * data.y.base_values.size
+
+    data = Array.from_shared(SharedArray(mock_x_table, y=Power(long_label='Power')), copy=False)
+    gc.collect()
+
+    data.y.base_values[...] = 4
+    assert np.all(data.y.base_values == 4)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+
+# -
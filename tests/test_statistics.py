@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pytest
+from DataVisual import Array, Table, statistics
+from DataVisual.statistics import mean_and_std, chunked_reduce, summarize
+from DataVisual.units import Length, Power
+
+
+@pytest.mark.parametrize("chunk_bytes", [2**20, 256], ids=['one chunk', 'many chunks'])
+@pytest.mark.parametrize("axis", [0, 1, 2, (0, 2), (1, 2), (0, 1, 2)], ids=lambda axis: f'axis: {axis}')
+def test_mean_and_std(monkeypatch, axis: int | tuple[int, ...], chunk_bytes: int):
+    """
+    Test that the chunked mean and standard deviation match the numpy reference implementation.
+
+    Args:
+        monkeypatch (MonkeyPatch): Used to set the size of the chunks.
+        axis (int | tuple[int, ...]): The axis, or axes, along which to reduce, provided by pytest's parameterization.
+        chunk_bytes (int): The size of the chunks, provided by pytest's parameterization.
+    """
+    monkeypatch.setattr(statistics, 'chunk_bytes', chunk_bytes)
+    values = 1 + np.random.rand(4, 5, 6)
+
+    mean, std = mean_and_std(values, axis=axis)
+
+    np.testing.assert_allclose(mean, np.mean(values, axis=axis))
+    np.testing.assert_allclose(std, np.std(values, axis=axis))
+
+    mean, std = mean_and_std(values, axis=axis, keepdims=True)
+
+    np.testing.assert_allclose(mean, np.mean(values, axis=axis, keepdims=True))
+    np.testing.assert_allclose(std, np.std(values, axis=axis, keepdims=True))
+
+
+@pytest.mark.parametrize("name", ['mean', 'std', 'rsd'])
+@pytest.mark.parametrize("axis", [1, (0, 2), (0, 1, 2)], ids=['axis: 1', 'axis: (0, 2)', 'axis: all'])
+def test_chunked_reduce(monkeypatch, name: str, axis):
+    """
+    Test that the chunk by chunk reductions match the in-memory ones, including when every axis is reduced.
+
+    Args:
+        monkeypatch (MonkeyPatch): Used to shrink the chunks so the values are split in many of them.
+        name (str): The name of the reduction, provided by pytest's parameterization.
+        axis (int | tuple[int, ...]): The reduction axes, provided by pytest's parameterization.
+    """
+    monkeypatch.setattr(statistics, 'chunk_bytes', 256)
+    values = 1 + np.random.rand(6, 7, 8)
+
+    np.testing.assert_allclose(
+        chunked_reduce(name, values, axis=axis),
+        statistics.reductions[name](values, axis=axis)
+    )
+
+
+@pytest.mark.parametrize("name", ['mean', 'std', 'rsd'])
+@pytest.mark.parametrize("axis", [1, (0, 2), (0, 1, 2)], ids=['axis: 1', 'axis: (0, 2)', 'axis: all'])
+def test_parallel_reduce(monkeypatch, name: str, axis):
+    """
+    Test that the thread-parallel reductions match the serial ones, and stay serial below the threshold.
+
+    Args:
+        monkeypatch (MonkeyPatch): Used to lower the size threshold of the parallel reductions.
+        name (str): The name of the reduction, provided by pytest's parameterization.
+        axis (int | tuple[int, ...]): The reduction axes, provided by pytest's parameterization.
+    """
+    values = 1 + np.random.rand(6, 7, 8)
+    expected = statistics.reductions[name](values, axis=axis)
+
+    monkeypatch.setattr(statistics, 'chunked_reduce', lambda *args, **kwargs: pytest.fail("Reduction is not serial"))
+    statistics.reduce(name, values, axis=axis, workers=3)
+    monkeypatch.undo()
+
+    monkeypatch.setattr(statistics, 'parallel_bytes', 0)
+    np.testing.assert_allclose(statistics.reduce(name, values, axis=axis, workers=3), expected)
+
+    parameters = [Length(base_values=np.arange(size), long_label=f'Length {idx}') for idx, size in enumerate(values.shape)]
+    data = Array(x_table=Table(parameters), y=Power(long_label='Power', base_values=values))
+    axes = [parameters[idx] for idx in np.atleast_1d(axis)]
+
+    np.testing.assert_allclose(getattr(data, name)(axis=axes, workers=3).y.base_values, expected)
+
+
+def test_summarize(monkeypatch):
+    """
+    Test that the chunked single-pass summary ignores NaN values and matches the numpy reference.
+
+    Args:
+        monkeypatch (MonkeyPatch): Used to shrink the chunks so the values are split in many of them.
+    """
+    monkeypatch.setattr(statistics, 'chunk_bytes', 256)
+    values = np.random.rand(20, 7) - 0.8
+    values[3, 2] = values[11, 0] = np.nan
+
+    summary = summarize(values)
+
+    assert summary.nan_count == 2
+    np.testing.assert_allclose(summary.minimum, np.nanmin(values))
+    np.testing.assert_allclose(summary.maximum, np.nanmax(values))
+    np.testing.assert_allclose(summary.abs_maximum, np.nanmax(np.abs(values)))
+    np.testing.assert_allclose(summary.mean, np.nanmean(values))
+    np.testing.assert_allclose(summary.std, np.nanstd(values))
+
+
+def test_nan_prefix():
+    """
+    Test that NaN values of an incomplete sweep do not pollute the SI prefix choice.
+    """
+    values = np.full(10, np.nan)
+    values[:5] = np.linspace(1e-6, 5e-6, 5)
+
+    unit = Length(base_values=values, long_label='Length')
+
+    assert unit.long_prefix == 'micro'
+
+
+def test_memmap_array(tmp_path, monkeypatch):
+    """
+    Test that an Array backed by a memory-mapped file is reduced chunk by chunk to the expected values.
+
+    Args:
+        tmp_path (Path): Temporary directory holding the memory-mapped file.
+        monkeypatch (MonkeyPatch): Used to shrink the chunks so the values are split in many of them.
+    """
+    monkeypatch.setattr(statistics, 'chunk_bytes', 256)
+
+    parameter_0 = Length(base_values=np.linspace(0, 1, 5), long_label='Length 0')
+    parameter_1 = Length(base_values=np.linspace(0, 1, 20), long_label='Length 1')
+    x_table = Table([parameter_0, parameter_1])
+
+    values = 1 + np.random.rand(5, 20)
+    values.tofile(tmp_path / 'y.bin')
+
+    data = Array.from_memmap(tmp_path / 'y.bin', x_table=x_table, y=Power(long_label='Power'))
+
+    assert isinstance(data.y.base_values, np.memmap)
+
+    mean, std, rsd = data.stats(axis=parameter_0)
+    np.testing.assert_allclose(mean.y.base_values, values.mean(axis=0))
+    np.testing.assert_allclose(std.y.base_values, values.std(axis=0))
+    np.testing.assert_allclose(rsd.y.base_values, values.std(axis=0) / values.mean(axis=0))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+
+# -
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import json
+import numpy as np
+import pytest
+from DataVisual import Array, Table
+from DataVisual.storage import ChunkedStore
+from DataVisual.units import Length, Power, Area
+
+
+@pytest.fixture
+def mock_array() -> Array:
+    """
+    Fixture to create a mock Array with two Length parameters and one Area parameter.
+
+    Returns:
+        Array: An Array object with random Power values.
+    """
+    parameter_0 = Length(base_values=np.linspace(0, 1, 4), long_label='Length 0', short_label='L0')
+    parameter_1 = Length(base_values=np.linspace(0, 1, 5), long_label='Length 1', short_label='L1')
+    parameter_2 = Area(base_values=np.linspace(0, 1, 6), long_label='Area 0', short_label='A0')
+
+    y = Power(long_label='Arbitrary measure', short_label='Arbit. measure', base_values=np.random.rand(4, 5, 6))
+
+    return Array(x_table=Table([parameter_0, parameter_1, parameter_2]), y=y)
+
+
+@pytest.mark.parametrize("mmap", [True, False], ids=['mmap', 'read'])
+def test_save_load(tmp_path, mock_array, mmap: bool):
+    """
+    Test that an Array saved to disk is loaded back with the same values, units and labels.
+
+    Args:
+        tmp_path (Path): Temporary directory to save the Array in.
+        mock_array (Array): Fixture providing the Array to save.
+        mmap (bool): Whether the y values are memory-mapped, provided by pytest's parameterization.
+    """
+    mock_array.save(tmp_path / 'array')
+
+    loaded = Array.load(tmp_path / 'array', mmap=mmap)
+
+    assert isinstance(loaded.y.base_values, np.memmap) == mmap
+    np.testing.assert_array_equal(loaded.y.base_values, mock_array.y.base_values)
+
+    for original, x in zip(mock_array.x_table, loaded.x_table):
+        assert type(x) is type(original)
+        assert x.long_label == original.long_label
+        assert x.short_label == original.short_label
+        np.testing.assert_array_equal(x.base_values, original.base_values)
+
+    assert type(loaded.y) is Power
+
+
+@pytest.mark.parametrize("compression", ['zlib', 'lzma', None], ids=['zlib', 'lzma', 'raw'])
+def test_chunked_store(tmp_path, mock_array, compression: str):
+    """
+    Test that selections on a chunked store only decompress the chunks they touch and match the in-memory values.
+
+    Args:
+        tmp_path (Path): Temporary directory to save the Array in.
+        mock_array (Array): Fixture providing the Array to save.
+        compression (str): The compression of the chunks, provided by pytest's parameterization.
+    """
+    mock_array.save_chunked(tmp_path / 'array', chunk_shape=(2, 2, 4), compression=compression)
+
+    store = Array.open_chunked(tmp_path / 'array')
+    parameter_0, parameter_1, parameter_2 = store.x_table
+
+    read_chunks = []
+    read_chunk = store.read_chunk
+    store.read_chunk = lambda file, grid_index: read_chunks.append(grid_index) or read_chunk(file, grid_index)
+
+    selection = store.isel({parameter_0: 1, 'Length 1': slice(1, 4), parameter_2: slice(None, None, 2)})
+
+    np.testing.assert_array_equal(selection.y.base_values, mock_array.y.base_values[1, 1:4, ::2])
+    np.testing.assert_array_equal(selection.x_table[0].base_values, parameter_1.base_values[1:4])
+    assert [x.long_label for x in selection.x_table] == ['Length 1', 'Area 0']
+    assert len(read_chunks) == 4
+
+    loaded = Array.load(tmp_path / 'array')
+    np.testing.assert_array_equal(loaded.y.base_values, mock_array.y.base_values)
+
+    selection = ChunkedStore(tmp_path / 'array').isel({'Length 0': 2})
+    assert type(selection) is Array
+    np.testing.assert_array_equal(selection.y.base_values, mock_array.y.base_values[2])
+
+
+def test_save_load_metadata(tmp_path, mock_array):
+    """
+    Test that the value representation of the units is saved, and that headers naming other classes are refused.
+
+    Args:
+        tmp_path (Path): Temporary directory to save the Array in.
+        mock_array (Array): Fixture providing the Array to save.
+    """
+    mock_array.x_table[0].value_representation = np.array(['a', 'b', 'c', 'd'])
+    mock_array.save(tmp_path / 'array')
+
+    loaded = Array.load(tmp_path / 'array')
+
+    np.testing.assert_array_equal(loaded.x_table[0].value_representation, ['a', 'b', 'c', 'd'])
+    assert loaded.x_table[1].value_representation is None
+
+    header_path = tmp_path / 'array' / 'header.json'
+    for module, cls in [('os', 'system'), ('DataVisual.tables', 'Table'), ('unknown_module', 'Unit')]:
+        header = json.loads(header_path.read_text())
+        header['y'].update(module=module, cls=cls)
+        header_path.write_text(json.dumps(header))
+
+        with pytest.raises(TypeError):
+            Array.load(tmp_path / 'array')
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+
+# -
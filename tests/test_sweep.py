@@ -0,0 +1,298 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import functools
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pytest
+from DataVisual import Array, SweepCache, Table, sweep
+from DataVisual.sweep import try_vectorized
+from DataVisual.units import Length, Power
+
+
+def scalar_function(length_0: float, length_1: float) -> float:
+    """Scalar-only function of two lengths, defined at the top level so a process pool can pickle it."""
+    return math.hypot(length_0, length_1) if length_0 > 0.5 else length_1
+
+
+@pytest.fixture
+def mock_x_table() -> Table:
+    """
+    Fixture to create a mock Table with two Length parameters.
+
+    Returns:
+        Table: A Table object containing two Length parameters.
+    """
+    parameter_0 = Length(base_values=np.linspace(0, 1, 7), long_label='Length 0')
+    parameter_1 = Length(base_values=np.linspace(0, 2, 9), long_label='Length 1')
+
+    return Table([parameter_0, parameter_1])
+
+
+@pytest.fixture
+def expected(mock_x_table) -> np.ndarray:
+    """
+    Fixture giving the reference values of `scalar_function` over the grid of the mock Table.
+
+    Returns:
+        np.ndarray: The values, computed with nested loops.
+    """
+    parameter_0, parameter_1 = mock_x_table
+
+    return np.array([[scalar_function(a, b) for b in parameter_1.base_values] for a in parameter_0.base_values])
+
+
+def test_from_function_vectorized(mock_x_table):
+    """
+    Test that a vectorized function is detected by, and evaluated in, a single call over the whole grid.
+
+    Args:
+        mock_x_table (Table): Fixture providing the x_table with two parameters.
+    """
+    calls = []
+
+    def func(length_0, length_1):
+        calls.append(np.shape(length_0))
+        return np.hypot(length_0, length_1)
+
+    data = Array.from_function(func, mock_x_table, y=Power(long_label='Power'))
+
+    assert calls == [(7, 1)]
+    assert data.shape == (7, 9)
+    np.testing.assert_allclose(
+        data.y.base_values,
+        np.hypot(mock_x_table[0].base_values[:, None], mock_x_table[1].base_values[None, :])
+    )
+
+
+def test_try_vectorized(mock_x_table):
+    """
+    Test that functions with scalar-only math or branches are detected as not vectorized, leaving the output untouched.
+
+    Args:
+        mock_x_table (Table): Fixture providing the x_table with two parameters.
+    """
+    out = np.zeros(mock_x_table.shape)
+    indices = np.array([3, 10, 40])
+
+    for func in (scalar_function, lambda a, b: math.sin(a) * b, lambda a, b: np.ones(2)):
+        assert not try_vectorized(func, mock_x_table, out=out)
+        assert not try_vectorized(func, mock_x_table, out=out, indices=indices)
+        assert not out.any()
+
+    assert try_vectorized(np.multiply, mock_x_table, out=out, indices=indices)
+    assert np.flatnonzero(out).tolist() == [10, 40]
+
+
+def test_from_function_process_pool(mock_x_table, expected):
+    """
+    Test that a scalar function is evaluated point by point over the default process pool.
+
+    Args:
+        mock_x_table (Table): Fixture providing the x_table with two parameters.
+        expected (np.ndarray): Fixture providing the reference values.
+    """
+    data = Array.from_function(scalar_function, mock_x_table, y=Power(long_label='Power'), chunk_size=10)
+
+    np.testing.assert_allclose(data.y.base_values, expected)
+
+
+def test_process_pool_shared_size(monkeypatch, tmp_path, mock_x_table, expected):
+    """
+    Test that the shared buffer of a process pool evaluation only holds the points missing from the cache.
+
+    Args:
+        monkeypatch (MonkeyPatch): Used to record the shape of the SharedArrays.
+        tmp_path (Path): Temporary directory holding the cache.
+        mock_x_table (Table): Fixture providing the x_table with two parameters.
+        expected (np.ndarray): Fixture providing the reference values.
+    """
+    shapes = []
+
+    class RecordingSharedArray(sweep.SharedArray):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            shapes.append(self.values.shape)
+
+    monkeypatch.setattr(sweep, 'SharedArray', RecordingSharedArray)
+
+    cache = SweepCache(tmp_path)
+    cache.put(cache.get_keys(scalar_function, mock_x_table)[5:], expected.reshape(-1)[5:])
+
+    data = Array.from_function(scalar_function, mock_x_table, y=Power(long_label='Power'), vectorized=False, cache=cache)
+
+    assert shapes == [(5,)]
+    np.testing.assert_allclose(data.y.base_values, expected)
+
+def test_from_function_executor(mock_x_table, expected):
+    """
+    Test that a scalar function is evaluated over a given executor, here a thread pool accepting closures.
+
+    Args:
+        mock_x_table (Table): Fixture providing the x_table with two parameters.
+        expected (np.ndarray): Fixture providing the reference values.
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        data = Array.from_function(
+            lambda a, b: scalar_function(a, b),
+            mock_x_table,
+            y=Power(long_label='Power'),
+            vectorized=False,
+            executor=executor,
+            chunk_size=4
+        )
+
+    np.testing.assert_allclose(data.y.base_values, expected)
+
+
+def test_sweep_cache(tmp_path, mock_x_table):
+    """
+    Test that a sweep with an extended axis only evaluates the points missing from the cache.
+
+    Args:
+        tmp_path (Path): Temporary directory holding the cache.
+        mock_x_table (Table): Fixture providing the x_table with two parameters.
+    """
+    n_evaluated = []
+
+    def func(length_0, length_1):
+        n_evaluated.append(np.size(length_0))
+        return np.hypot(length_0, length_1)
+
+    parameter_0, parameter_1 = mock_x_table
+    cache = SweepCache(tmp_path / 'cache')
+
+    Array.from_function(func, mock_x_table, y=Power(long_label='Power'), vectorized=True, cache=cache)
+    assert n_evaluated == [7 * 9] and len(cache) == 7 * 9
+
+    extended = Length(base_values=np.linspace(0, 1.5, 10), long_label='Length 0')
+    x_table = Table([extended, parameter_1])
+
+    n_evaluated.clear()
+    data = Array.from_function(func, x_table, y=Power(long_label='Power'), vectorized=True, cache=SweepCache(tmp_path / 'cache'))
+
+    assert n_evaluated == [3 * 9]
+    np.testing.assert_allclose(data.y.base_values, np.hypot(extended.base_values[:, None], parameter_1.base_values[None, :]))
+
+
+def test_sweep_cache_eviction(tmp_path, mock_x_table):
+    """
+    Test that the least recently used results are evicted beyond the maximum number of entries.
+
+    Args:
+        tmp_path (Path): Temporary directory holding the cache.
+        mock_x_table (Table): Fixture providing the x_table with two parameters.
+    """
+    cache = SweepCache(tmp_path, max_entries=3)
+
+    for idx, key in enumerate([b'a', b'b', b'c']):
+        cache.put(np.array([key], dtype='S16'), np.array([float(idx)]))
+
+    cache.get(np.array([b'a'], dtype='S16'), dtype=np.float64)
+    cache.put(np.array([b'd'], dtype='S16'), np.array([3.]))
+
+    found, values = cache.get(np.array([b'a', b'b', b'c', b'd'], dtype='S16'), dtype=np.float64)
+
+    assert len(cache) == 3
+    assert found.tolist() == [True, False, True, True]
+    assert values.tolist() == [0., 2., 3.]
+
+    keys = cache.get_keys(np.hypot, mock_x_table)
+    assert len(set(keys)) == 7 * 9
+    assert not np.any(keys == cache.get_keys(np.add, mock_x_table))
+
+
+def test_sweep_cache_function_key(tmp_path, mock_x_table):
+    """
+    Test that functions differing only by their closure, defaults or partial arguments get different cache keys.
+
+    Args:
+        tmp_path (Path): Temporary directory holding the cache.
+        mock_x_table (Table): Fixture providing the x_table with two parameters.
+    """
+    def make(scale):
+        def func(length_0, length_1):
+            return scale * np.hypot(length_0, length_1)
+        return func
+
+    def scaled(length_0, length_1, scale=1.):
+        return scale * np.hypot(length_0, length_1)
+
+    cache = SweepCache(tmp_path)
+    expected = np.hypot(*np.meshgrid(*(x.base_values for x in mock_x_table), indexing='ij'))
+
+    for func, scale in [(make(1), 1), (make(100), 100), (functools.partial(scaled, scale=3.), 3)]:
+        data = Array.from_function(func, mock_x_table, y=Power(long_label='Power'), vectorized=True, cache=cache)
+        np.testing.assert_allclose(data.y.base_values, scale * expected)
+
+    scaled.__defaults__ = (5.,)
+    data = Array.from_function(scaled, mock_x_table, y=Power(long_label='Power'), vectorized=True, cache=cache)
+    np.testing.assert_allclose(data.y.base_values, 5 * expected)
+
+    assert cache.get_function_key(make(1)) == cache.get_function_key(make(1))
+    assert cache.get_function_key(make(1), key='v1') == cache.get_function_key(make(2), key='v1')
+
+    lock = threading.Lock()
+    with pytest.raises(TypeError):
+        cache.get_function_key(lambda value: lock and value)
+
+
+def test_sweep_cache_attribute_names(tmp_path, mock_x_table):
+    """
+    Test that editing a function to call another attribute of a module, numpy.cos instead of numpy.sin, changes its key.
+
+    Args:
+        tmp_path (Path): Temporary directory holding the cache.
+        mock_x_table (Table): Fixture providing the x_table with two parameters.
+    """
+    def sine(length_0, length_1):
+        return np.sin(length_0) + length_1
+
+    def cosine(length_0, length_1):
+        return np.cos(length_0) + length_1
+
+    # Same name and bytecode, as a function whose body was edited between two sweeps
+    cosine.__qualname__ = sine.__qualname__
+    assert cosine.__code__.co_code == sine.__code__.co_code
+
+    cache = SweepCache(tmp_path)
+    assert cache.get_function_key(sine) != cache.get_function_key(cosine)
+
+    x_0, x_1 = np.meshgrid(*(x.base_values for x in mock_x_table), indexing='ij')
+
+    for func, expected in [(sine, np.sin(x_0) + x_1), (cosine, np.cos(x_0) + x_1)]:
+        data = Array.from_function(func, mock_x_table, y=Power(long_label='Power'), vectorized=True, cache=cache)
+        np.testing.assert_allclose(data.y.base_values, expected)
+
+    real = lambda value: value.real  # noqa: E731
+    imag = lambda value: value.imag  # noqa: E731
+    assert cache.get_function_key(real) != cache.get_function_key(imag)
+
+
+def test_sweep_cache_get_keeps_store(tmp_path, mock_x_table):
+    """
+    Test that looking up cached results only updates the access stamps, without rewriting the stored results.
+
+    Args:
+        tmp_path (Path): Temporary directory holding the cache.
+        mock_x_table (Table): Fixture providing the x_table with two parameters.
+    """
+    cache = SweepCache(tmp_path)
+    Array.from_function(np.hypot, mock_x_table, y=Power(long_label='Power'), vectorized=True, cache=cache)
+
+    store = cache.get_path(np.float64).stat()
+    stamps = np.load(cache.get_stamps_path(np.float64)).copy()
+
+    Array.from_function(np.hypot, mock_x_table, y=Power(long_label='Power'), vectorized=True, cache=cache)
+
+    assert cache.get_path(np.float64).stat().st_mtime_ns == store.st_mtime_ns
+    assert np.all(np.load(cache.get_stamps_path(np.float64)) > stamps)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+
+# -
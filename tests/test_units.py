@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 # -*- coding: utf-8; py-indent-offset:4 -*-
 
+import pickle
 import pytest
 import numpy as np
 from DataVisual.units import components
@@ -34,6 +35,128 @@ def test_units(scaling, unit_string: str):
     print(unit)
 
 
+@pytest.mark.parametrize("unit_string", components.__all__, ids=components.__all__)
+def test_units_are_slotted(unit_string: str):
+    """
+    Test that unit instances do not carry a per-instance __dict__ while keeping their class-level constants.
+
+    Args:
+        unit_string (str): The name of the unit class to test, provided by pytest's parameterization.
+    """
+    unit_class = getattr(components, unit_string)
+
+    unit = unit_class(base_values=np.linspace(0, 1, 10), long_label='Unit')
+
+    assert not hasattr(unit, '__dict__')
+    assert unit.use_prefix == unit_class.default_use_prefix
+    assert isinstance(unit_class.power, int)
+
+    with pytest.raises(AttributeError):
+        unit.undeclared_attribute = None
+
+
+def test_clone_shares_arrays():
+    """
+    Test that cloning a unit copies its metadata but shares its arrays, and that new base values
+    or attributes only affect the clone.
+    """
+    unit = components.Power(
+        base_values=1e-3 * np.random.rand(10, 10),
+        long_label='Unit',
+        short_label='U0'
+    )
+
+    unit.values  # Computes the cached scaled values
+    clone = unit.clone()
+    assert clone is not unit
+    assert clone.base_values is unit.base_values
+    assert clone.values is unit.values
+
+    clone = unit.clone(base_values=np.ones(3))
+    assert clone.long_label == unit.long_label
+    assert clone.shape == (3,)
+    assert unit.shape == (10, 10)
+
+    clone = unit.clone(normalized=True)
+    assert clone.normalized and not unit.normalized
+    assert np.isclose(clone.values.max(), 1)
+
+
+def test_representations_cache():
+    """
+    Test that the cached value representations match get_representation and are invalidated with the values.
+    """
+    unit = components.Length(base_values=np.linspace(0, 1e-6, 5), long_label='Unit', short_label='U0')
+
+    representations = unit.get_representations(add_unit=True, use_short_repr=True)
+    assert unit.get_representations(add_unit=True, use_short_repr=True) is representations
+
+    for index, representation in enumerate(representations):
+        assert representation == unit.get_representation(index=index, add_unit=True, use_short_repr=True)
+
+    unit.set_base_values(np.linspace(0, 1e3, 5))
+    representations = unit.get_representations(add_unit=True, use_short_repr=True)
+    assert representations[-1] == unit.get_representation(index=4, add_unit=True, use_short_repr=True)
+    assert representations[-1].endswith('[m]')
+
+
+def test_lazy_scaling():
+    """
+    Test that the scaled values are only computed on access and are reset when the scaling settings change.
+    """
+    unit = components.Length(base_values=np.linspace(0, 1e-6, 5), long_label='Unit')
+
+    assert unit._values is None
+    assert unit.short_prefix == r'$\mu$'
+    np.testing.assert_allclose(unit.values, unit.base_values * 1e6)
+
+    unit.use_prefix = False
+    assert unit._values is None
+    assert unit.values is unit.base_values
+
+    unit.normalized = True
+    unit.use_prefix = True
+    assert unit.short_prefix == ''
+    np.testing.assert_allclose(unit.values.max(), 1)
+
+
+@pytest.mark.parametrize("fill", [0., np.nan], ids=['zeros', 'nan'])
+def test_normalized_degenerate_values(fill: float):
+    """
+    Test that values whose maximum is zero or NaN are left unscaled when normalized, rather than divided by it.
+
+    Args:
+        fill (float): The value of every element, provided by pytest's parameterization.
+    """
+    unit = components.Power(base_values=np.full(5, fill), long_label='Unit', normalized=True)
+
+    assert unit.scale_factor == 1
+    np.testing.assert_array_equal(unit.values, unit.base_values)
+
+
+@pytest.mark.parametrize("protocol", [4, 5], ids=['protocol: 4', 'protocol: 5'])
+def test_pickle(protocol: int):
+    """
+    Test that units are pickled without their derived arrays, which are recomputed lazily once unpickled.
+
+    Args:
+        protocol (int): The pickle protocol, provided by pytest's parameterization.
+    """
+    unit = components.Length(base_values=np.linspace(0, 1e-6, 5), long_label='Unit', use_prefix=True)
+    _ = unit.values, unit.summary, unit.get_representations()
+
+    new_unit = pickle.loads(pickle.dumps(unit, protocol=protocol))
+
+    assert type(new_unit) is components.Length
+    assert new_unit._values is None and new_unit._summary is None
+    assert new_unit.long_label == 'Unit' and new_unit.use_prefix
+    np.testing.assert_array_equal(new_unit.base_values, unit.base_values)
+    np.testing.assert_allclose(new_unit.values, unit.values)
+
+    sliced = unit.clone(base_values=unit.base_values[::2])
+    np.testing.assert_array_equal(pickle.loads(pickle.dumps(sliced, protocol=protocol)).base_values, sliced.base_values)
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
 